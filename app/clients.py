@@ -10,7 +10,25 @@ every retired network method raises 410 Gone.
 """
 from __future__ import annotations
 
+import atexit
+
+import httpx
+
 from .tip_parser import RetiredProvider, TipTextParser
 
 ireel_client = TipTextParser()      # .parse_tips_text lives; the rest 410s
 gemini_client = RetiredProvider()   # everything 410s
+
+# Shared keep-alive pool for the cron's upstream fetches (RA crawler, PF
+# scratchings/conditions, stablfy-social clones), so repeat calls to the
+# same host reuse TCP + TLS instead of a fresh handshake per fetch. Callers
+# pass their own per-request timeout.
+http_client = httpx.Client(
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_connections=32,
+        max_keepalive_connections=16,
+        keepalive_expiry=300,
+    ),
+)
+atexit.register(http_client.close)
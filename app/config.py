@@ -8,6 +8,19 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./tips_results.db"
     environment: str = "local"
 
+    # SQLAlchemy connection pool (Postgres only). The sync-route thread pool
+    # is capped at pool_size + max_overflow so requests queue for a thread
+    # rather than stalling on pool_timeout while holding one.
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    # Seconds a request waits for a pooled connection before failing fast,
+    # rather than hanging a UI page behind a stuck burst.
+    db_pool_timeout: float = 10.0
+
+    # Dev/CI guard: make hot UI queries raise on any relationship access that
+    # would lazy-load (N+1) instead of silently querying. Off in production.
+    sql_raiseload: bool = False
+
     # RA crawler + PF scratchings services
     ra_crawler_base_url: str = "https://ra-crawler.onrender.com"
     pf_scratchings_base_url: str = "https://pf-scratchings-conditions.onrender.com"
@@ -22,6 +35,9 @@ class Settings(BaseSettings):
     ireel_api_key: str | None = None
     ireel_api_base_url: str = "https://api.ireel.ai"
     ireel_assistant_id: str | None = None
+    # Sustained request rate (and burst size) allowed against iReel across
+    # all cron worker threads.
+    ireel_max_requests_per_sec: float = 4.0
 
     # Gemini (via Stablfy API) config
     stablfy_api_url: str = "https://api.stablfy.com"
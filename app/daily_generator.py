@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import date, datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Tuple, Optional, Sequence, Set
 
 import re
-import httpx
 from zoneinfo import ZoneInfo
 
+from .clients import http_client
 from .config import settings
 from . import schemas, pf_meeting_resolver
 
@@ -21,11 +22,20 @@ def today_mel() -> date:
 # TRACK NAME MATCHING (RA ↔ PF)
 # ----------------------------
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
 def _normalize_track_name(name: str | None) -> str:
-    """Lowercase, collapse spaces; safe on None."""
+    """
+    Lowercase, collapse spaces; safe on None.
+
+    Cached: the set of track names is small, but _tracks_match is called
+    for every RA candidate of every tip on the overview/results pages.
+    """
     if not name:
         return ""
-    return re.sub(r"\s+", " ", name).strip().lower()
+    return _WHITESPACE_RE.sub(" ", name).strip().lower()
 
 
 def _tracks_match(a: str, b: str) -> bool:
@@ -88,10 +98,9 @@ def _fetch_ra_races_for_date(target_date: date) -> List[Dict[str, Any]]:
     url = f"{base}/races"
     params = {"date": target_date.isoformat()}
 
-    with httpx.Client(timeout=20.0) as client:
-        resp = client.get(url, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = http_client.get(url, params=params, timeout=20.0)
+    resp.raise_for_status()
+    data = resp.json()
 
     if isinstance(data, dict) and "races" in data:
         races = data["races"]
@@ -128,10 +137,9 @@ def _fetch_pf_scratchings_lookup(target_date: date) -> Dict[Tuple[str, int], Lis
     url = f"{base}/scratchings/grouped"
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = http_client.get(url, timeout=10.0)
+        resp.raise_for_status()
+        data = resp.json()
     except Exception as e:
         print(f"[SCR] error fetching scratchings: {e}")
         return {}
@@ -193,10 +201,9 @@ def _fetch_pf_track_conditions(target_date: date) -> Dict[str, str]:
     url = f"{base}/conditions/flat"
 
     try:
-        with httpx.Client(timeout=10.0) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            data = resp.json()
+        resp = http_client.get(url, timeout=10.0)
+        resp.raise_for_status()
+        data = resp.json()
     except Exception as e:
         print(f"[COND] error fetching track conditions: {e}")
         return {}
@@ -340,6 +347,7 @@ def build_generate_tips_payloads_for_date(
     project_id: str,
     *,
     force_all_meetings: bool = False,
+    only_pf_meeting_id: int | None = None,
 ) -> List[schemas.GenerateTipsIn]:
     """
     Build one GenerateTipsIn payload per meeting for the given date,
@@ -363,6 +371,9 @@ def build_generate_tips_payloads_for_date(
     Manual overrides:
       - /cron/generate-meeting-tips uses force_all_meetings=True so you
         can always pull ANY meeting (even small Country cards) by pf_meeting_id.
+      - only_pf_meeting_id drops every other meeting as soon as its
+        pf_meeting_id is known, before the per-race scratchings/conditions
+        work, for callers that only want one meeting.
     """
     races = _fetch_ra_races_for_date(target_date)
     scratchings_lookup = _fetch_pf_scratchings_lookup(target_date)
@@ -496,6 +507,9 @@ def build_generate_tips_payloads_for_date(
                 f"{track_name} {state} on {meeting_date}"
             )
 
+        if only_pf_meeting_id is not None and pf_meeting_id != only_pf_meeting_id:
+            continue
+
         # --- Track condition: exact, then fuzzy via _tracks_match ---
         track_condition_for_meeting: str | None = None
 
@@ -1,6 +1,7 @@
 # app/database.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.schema import CreateIndex
 
 from .config import settings
 
@@ -21,6 +22,9 @@ else:
     pool_settings = {
         "pool_pre_ping": True,  # Test connections before using, auto-reconnect stale
         "pool_recycle": 300,    # Recycle connections every 5 minutes
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
     }
 
 engine = create_engine(
@@ -33,6 +37,39 @@ engine = create_engine(
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def ensure_indexes() -> None:
+    """
+    Create any model-declared indexes that are missing on existing tables.
+
+    create_all() only emits CREATE INDEX for tables it creates itself, so
+    indexes added to a model after its table exists need this pass. Run it
+    once per deploy via scripts/ensure_indexes.py, not at app import.
+
+    On Postgres each index is built with CREATE INDEX CONCURRENTLY IF NOT
+    EXISTS (autocommit, no write lock on the table, safe to re-run).
+    """
+    # Tables that don't exist yet get their indexes from create_all().
+    existing = set(inspect(engine).get_table_names())
+    tables = [t for t in Base.metadata.sorted_tables if t.name in existing]
+
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            for table in tables:
+                for index in table.indexes:
+                    # Only for this statement; create_all() runs in a
+                    # transaction, where CONCURRENTLY is not allowed.
+                    index.dialect_kwargs["postgresql_concurrently"] = True
+                    try:
+                        conn.execute(CreateIndex(index, if_not_exists=True))
+                    finally:
+                        index.dialect_kwargs["postgresql_concurrently"] = False
+        return
+
+    for table in tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
 def get_db():
     """FastAPI dependency that yields a DB session."""
     db = SessionLocal()
@@ -1,6 +1,13 @@
 # app/main.py
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
@@ -18,9 +25,31 @@ from .routes_trends import router as trends_router
 from .routes_reasoning import router as reasoning_router
 from .routes_meeting_best import router as meeting_best_router
 
+# Log records are handed off to a queue; a background listener thread does
+# the formatting and the blocking write to stderr. Only the app's own
+# loggers (app.*) are raised to INFO; third-party loggers (httpx etc.) keep
+# their defaults.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger("app").setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title=settings.app_name)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync `def` routes run on anyio's default thread limiter; size it to the
+    # DB pool so threads never outnumber connections.
+    if not settings.database_url.startswith("sqlite"):
+        limiter = anyio.to_thread.current_default_thread_limiter()
+        limiter.total_tokens = settings.db_pool_size + settings.db_max_overflow
+    yield
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
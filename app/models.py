@@ -6,12 +6,14 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     Numeric,
     JSON,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.sqlite import BLOB as SQLITE_BLOB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
@@ -55,6 +57,13 @@ class Meeting(Base):
 
     __table_args__ = (
         UniqueConstraint("date", "track_name", "state", name="uq_meeting_date_track"),
+        # Partial index: most lookups by pf_meeting_id hit the few rows that have one.
+        Index(
+            "ix_meetings_pf_meeting_id",
+            "pf_meeting_id",
+            postgresql_where=text("pf_meeting_id IS NOT NULL"),
+            sqlite_where=text("pf_meeting_id IS NOT NULL"),
+        ),
     )
 
 
@@ -106,6 +115,10 @@ class TipRun(Base):
     meeting: Mapped["Meeting | None"] = relationship("Meeting")
     tips: Mapped[list["Tip"]] = relationship("Tip", back_populates="tip_run")
 
+    __table_args__ = (
+        Index("ix_tip_runs_meeting_id", "meeting_id"),
+    )
+
 
 class Tip(Base):
     __tablename__ = "tips"
@@ -133,9 +146,16 @@ class Tip(Base):
 
     tip_run: Mapped["TipRun"] = relationship("TipRun", back_populates="tips")
     race: Mapped["Race"] = relationship("Race", back_populates="tips")
+    # Read-side shortcut for eager loading; TipOutcome rows are written
+    # through TipOutcome.tip.
+    outcome: Mapped["TipOutcome | None"] = relationship(
+        "TipOutcome", uselist=False, viewonly=True
+    )
 
     __table_args__ = (
         UniqueConstraint("tip_run_id", "race_id", "tip_type", name="uq_tip_unique"),
+        # uq_tip_unique leads with tip_run_id, so race_id joins need their own index.
+        Index("ix_tips_race_id", "race_id"),
     )
 class RaceResult(Base):
     """
@@ -178,6 +198,7 @@ class RaceResult(Base):
         UniqueConstraint(
             "provider", "race_id", "tab_number", name="uq_result_race_provider_tab"
         ),
+        Index("ix_race_results_race_id", "race_id"),
     )
 
 
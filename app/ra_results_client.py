@@ -2,9 +2,13 @@
 from __future__ import annotations
 
 import os
+import sys
+import threading
+import time
 from dataclasses import dataclass
-from datetime import date
-from typing import List, Optional, Any
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any, Tuple
+from zoneinfo import ZoneInfo
 
 import httpx
 
@@ -88,8 +92,10 @@ class RAResultsClient:
         rows: List[RAResultRow] = []
 
         for item in items:
-            state = (item.get("state") or "").upper()
-            track = item.get("track") or ""
+            # Canonicalise once here (stripped, state upper-cased, interned)
+            # so index builders can key on these strings as-is.
+            state = sys.intern((item.get("state") or "").strip().upper())
+            track = sys.intern((item.get("track") or "").strip())
             if not state or not track:
                 continue
 
@@ -137,3 +143,76 @@ class RAResultsClient:
             )
 
         return rows
+
+
+# ============================================================================
+# Read-side cache for UI pages. Past days' results are final, so they're
+# kept for a day; today's are still landing, so they expire after a minute.
+# Ingest jobs should keep calling RAResultsClient directly.
+# ============================================================================
+_PAST_DAY_TTL_SECONDS = 24 * 60 * 60
+_TODAY_TTL_SECONDS = 60
+# Bounded like the overview caches; expired days go first, then the oldest.
+_RESULTS_CACHE_MAX_ENTRIES = 64
+
+# date -> (expires_at, rows). The TTL is fixed when the day is fetched: rows
+# fetched while the day was still today are partial and must not pick up
+# the past-day TTL once midnight passes.
+_results_cache: Dict[date, Tuple[float, List[RAResultRow]]] = {}
+_results_cache_lock = threading.Lock()
+# One lock per date so concurrent misses (overview + day page, or two
+# overlapping windows) make a single request for that day.
+_results_date_locks: Dict[date, threading.Lock] = {}
+
+
+def _cache_ttl_for(d: date) -> int:
+    today = datetime.now(ZoneInfo("Australia/Melbourne")).date()
+    return _PAST_DAY_TTL_SECONDS if d < today else _TODAY_TTL_SECONDS
+
+
+def fetch_results_for_date_cached(d: date) -> List[RAResultRow]:
+    """
+    RAResultsClient.fetch_results_for_date with a per-date TTL cache.
+    Errors are not cached; they propagate to the caller as before.
+    """
+    cached = _results_cache.get(d)
+    if cached is not None and time.time() < cached[0]:
+        return cached[1]
+
+    with _results_cache_lock:
+        date_lock = _results_date_locks.setdefault(d, threading.Lock())
+
+    with date_lock:
+        # Another thread may have filled it while we waited.
+        cached = _results_cache.get(d)
+        if cached is not None and time.time() < cached[0]:
+            return cached[1]
+
+        # Decided before the request so a fetch straddling midnight still
+        # counts as today's (partial) results.
+        ttl = _cache_ttl_for(d)
+        client = RAResultsClient()
+        try:
+            rows = client.fetch_results_for_date(d)
+        finally:
+            client.close()
+
+        _store_results(d, rows, ttl)
+        return rows
+
+
+def _store_results(d: date, rows: List[RAResultRow], ttl: int) -> None:
+    now = time.time()
+    with _results_cache_lock:
+        _results_cache.pop(d, None)
+        if len(_results_cache) >= _RESULTS_CACHE_MAX_ENTRIES:
+            for day in [k for k, (expires_at, _) in _results_cache.items() if now >= expires_at]:
+                del _results_cache[day]
+        while len(_results_cache) >= _RESULTS_CACHE_MAX_ENTRIES:
+            _results_cache.pop(next(iter(_results_cache)))
+        _results_cache[d] = (now + ttl, rows)
+
+        # Drop per-date locks for evicted days; a lock that's held belongs to
+        # an in-flight fetch and stays until a later store.
+        for day in [k for k, lock in _results_date_locks.items() if k not in _results_cache and not lock.locked()]:
+            del _results_date_locks[day]
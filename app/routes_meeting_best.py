@@ -9,14 +9,13 @@ from datetime import date as date_type, timedelta
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from .database import get_db
+from .ui_helpers import templates
 from .meeting_best_analytics import compute_meeting_best_trends
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
 
 
 @router.get("/api/meeting-best")
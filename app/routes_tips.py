@@ -1,20 +1,140 @@
 from __future__ import annotations
 
+import logging
+import threading
 import time
+import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date as date_type
+from itertools import groupby
 from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
 
 from .database import get_db
 from . import schemas, models, daily_generator, pf_meeting_resolver
-from .clients import ireel_client, gemini_client
+from .clients import ireel_client, gemini_client, http_client
 from .config import settings
 
 router = APIRouter()
 
+log = logging.getLogger(__name__)
+
+# Built once at import so the hot response-building loops reuse the compiled
+# validators instead of resolving them per model_validate() call.
+_TIPS_ADAPTER = TypeAdapter(list[schemas.TipOut])
+_RACE_ADAPTER = TypeAdapter(schemas.RaceOut)
+_MEETING_ADAPTER = TypeAdapter(schemas.MeetingOut)
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket: acquire() returns immediately while tokens are
+    available and only blocks once the burst allowance is spent.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+# Shared by every iReel worker thread (races and meetings alike), so the
+# request rate stays inside iReel's quota however the pools are sized.
+_ireel_bucket = _TokenBucket(
+    rate=settings.ireel_max_requests_per_sec,
+    capacity=settings.ireel_max_requests_per_sec,
+)
+
+# iReel per-race generation is network-bound, so races within a meeting are
+# dispatched on a small thread pool instead of one-by-one. Throughput is
+# capped by _ireel_bucket, not by the pool size.
+IREEL_MAX_PARALLEL = 4
+
+# Meetings the daily cron generates concurrently. Each fans out to
+# IREEL_MAX_PARALLEL race calls of its own.
+CRON_MEETING_PARALLEL = 4
+
+
+def _generate_ireel_race_entries(
+    meeting: schemas.MeetingBase,
+    race_ctxs: list[schemas.RaceGenerationIn],
+    project_id: Optional[str],
+    log_prefix: str = "[CRON]",
+) -> list[dict[str, Any]]:
+    """
+    Call iReel once per race (concurrently, bounded by IREEL_MAX_PARALLEL)
+    and return the `races` entries for a TipsBatchIn, in race-card order.
+    Races that error or come back empty are dropped.
+    """
+
+    def _generate_one(race_ctx):
+        race_in = race_ctx.race
+        scratchings = race_ctx.scratchings or []
+        track_condition = race_ctx.track_condition
+
+        log.info(
+            "%s calling iReel for %s R%s, scratchings=%s, cond=%r",
+            log_prefix,
+            getattr(meeting, "track_name", meeting),
+            getattr(race_in, "race_number", "?"),
+            scratchings,
+            track_condition,
+        )
+
+        _ireel_bucket.acquire()
+        try:
+            tip_dicts = ireel_client.generate_race_tips(
+                meeting=meeting,
+                race=race_in,
+                scratchings=scratchings,
+                track_condition=track_condition,
+                project_id=project_id,
+            )
+        except Exception as e:
+            log.warning(
+                "%s iReel error for %s R%s: %s",
+                log_prefix,
+                getattr(meeting, "track_name", meeting),
+                getattr(race_in, "race_number", "?"),
+                e,
+            )
+            tip_dicts = []
+
+        return race_in, tip_dicts
+
+    if not race_ctxs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(IREEL_MAX_PARALLEL, len(race_ctxs))) as executor:
+        results = list(executor.map(_generate_one, race_ctxs))
+
+    return [
+        {"race": race_in, "tips": tip_dicts}
+        for race_in, tip_dicts in results
+        if tip_dicts
+    ]
+
 
 def _meeting_has_tips(
     db: Session,
@@ -31,38 +151,73 @@ def _meeting_has_tips(
     (e.g. "iReel" or "Gemini"). This allows parallel tip generation
     from multiple providers for the same meeting.
     """
-    # First try to find the meeting
-    meeting: models.Meeting | None = None
-
-    # Try pf_meeting_id first if available
+    # One EXISTS over tip_runs JOIN meetings: the meeting is matched on
+    # pf_meeting_id (when known) or the natural key, and the DB can stop at
+    # the first matching tip_run instead of counting them all.
+    meeting_match = and_(
+        models.Meeting.date == meeting_date,
+        models.Meeting.track_name == track_name,
+        models.Meeting.state == state,
+    )
     if pf_meeting_id is not None:
-        meeting = (
-            db.query(models.Meeting)
-            .filter(models.Meeting.pf_meeting_id == pf_meeting_id)
-            .first()
+        meeting_match = or_(
+            models.Meeting.pf_meeting_id == pf_meeting_id,
+            meeting_match,
         )
 
-    # Fallback to natural key
-    if meeting is None:
-        meeting = (
-            db.query(models.Meeting)
-            .filter(
-                models.Meeting.date == meeting_date,
-                models.Meeting.track_name == track_name,
-                models.Meeting.state == state,
-            )
-            .first()
-        )
+    q = (
+        select(models.TipRun.id)
+        .join(models.Meeting, models.TipRun.meeting_id == models.Meeting.id)
+        .where(meeting_match)
+    )
+    if source:
+        q = q.where(models.TipRun.source == source)
+
+    return bool(db.scalar(select(q.exists())))
 
-    if meeting is None:
-        return False
 
-    # Check if TipRun exists for this meeting (optionally filtered by source)
-    q = db.query(models.TipRun).filter(models.TipRun.meeting_id == meeting.id)
+def _meetings_with_tips(
+    db: Session,
+    meeting_date: date_type,
+    pf_meeting_ids: list[int],
+    source: Optional[str] = None,
+) -> tuple[set[int], set[tuple[date_type, str, str]]]:
+    """
+    Bulk form of _meeting_has_tips for a sweep over one date.
+
+    Returns (pf_meeting_ids, natural keys) of meetings that already have
+    tip runs, so each payload can be checked with two set lookups instead
+    of a query apiece. pf_meeting_id matches are not date-bound, same as
+    _meeting_has_tips.
+    """
+    meeting_match = models.Meeting.date == meeting_date
+    if pf_meeting_ids:
+        meeting_match = or_(
+            meeting_match,
+            models.Meeting.pf_meeting_id.in_(pf_meeting_ids),
+        )
+
+    q = (
+        select(
+            models.Meeting.pf_meeting_id,
+            models.Meeting.date,
+            models.Meeting.track_name,
+            models.Meeting.state,
+        )
+        .join(models.TipRun, models.TipRun.meeting_id == models.Meeting.id)
+        .where(meeting_match)
+        .distinct()
+    )
     if source:
-        q = q.filter(models.TipRun.source == source)
+        q = q.where(models.TipRun.source == source)
 
-    return q.count() > 0
+    existing_pf: set[int] = set()
+    existing_nk: set[tuple[date_type, str, str]] = set()
+    for row in db.execute(q):
+        if row.pf_meeting_id is not None:
+            existing_pf.add(row.pf_meeting_id)
+        existing_nk.add((row.date, row.track_name, row.state))
+    return existing_pf, existing_nk
 
 
 @router.post("/tips/batch", response_model=schemas.MeetingTipsOut)
@@ -79,6 +234,65 @@ def create_tips_batch(
     - Creates Tips for each race
     - Returns MeetingTipsOut
     """
+    return _persist_tips_batch(db, payload)
+
+
+# Response builders for rows this process has just written: the column
+# values are already the right types, so skip Pydantic validation and only
+# coerce what the ORM hands back differently (str ids, Decimal stakes).
+def _tip_out(tip: models.Tip) -> schemas.TipOut:
+    return schemas.TipOut.model_construct(
+        id=uuid.UUID(tip.id),
+        tip_type=tip.tip_type,
+        tab_number=tip.tab_number,
+        horse_name=tip.horse_name,
+        reasoning=tip.reasoning,
+        stake_units=float(tip.stake_units),
+    )
+
+
+def _race_out(race: models.Race) -> schemas.RaceOut:
+    return schemas.RaceOut.model_construct(
+        id=uuid.UUID(race.id),
+        race_number=race.race_number,
+        name=race.name,
+        distance_m=race.distance_m,
+        class_text=race.class_text,
+        scheduled_start=race.scheduled_start,
+        pf_meeting_id=None,
+    )
+
+
+def _meeting_out(meeting: models.Meeting) -> schemas.MeetingOut:
+    return schemas.MeetingOut.model_construct(
+        id=uuid.UUID(meeting.id),
+        date=meeting.date,
+        track_name=meeting.track_name,
+        state=meeting.state,
+        country=meeting.country,
+        pf_meeting_id=meeting.pf_meeting_id,
+        ra_meetcode=meeting.ra_meetcode,
+    )
+
+
+def _dialect_insert(db: Session, model):
+    """INSERT construct for the bound dialect, so on_conflict_do_update is available."""
+    if db.get_bind().dialect.name == "postgresql":
+        return pg_insert(model)
+    return sqlite_insert(model)
+
+
+def _persist_tips_batch(
+    db: Session,
+    payload: schemas.TipsBatchIn,
+    *,
+    commit: bool = True,
+) -> schemas.MeetingTipsOut:
+    """
+    Body of /tips/batch. With commit=False the rows are only flushed, so a
+    caller sweeping many meetings can wrap each one in a savepoint and pay
+    for a single COMMIT at the end.
+    """
     m = payload.meeting
 
     # --- Upsert Meeting (robust against existing rows) ---
@@ -92,21 +306,10 @@ def create_tips_batch(
             .first()
         )
 
-    # 2) Fallback: natural key (date, track_name, state)
-    if meeting is None:
-        meeting = (
-            db.query(models.Meeting)
-            .filter(
-                models.Meeting.date == m.date,
-                models.Meeting.track_name == m.track_name,
-                models.Meeting.state == m.state,
-            )
-            .first()
-        )
-
     if meeting is None:
-        # Brand new meeting
-        meeting = models.Meeting(
+        # 2) Natural key (date, track_name, state): one INSERT ... ON CONFLICT
+        #    DO UPDATE instead of SELECT-then-branch.
+        upsert = _dialect_insert(db, models.Meeting).values(
             date=m.date,
             track_name=m.track_name,
             state=m.state,
@@ -114,14 +317,24 @@ def create_tips_batch(
             pf_meeting_id=m.pf_meeting_id,
             ra_meetcode=m.ra_meetcode,
         )
-        db.add(meeting)
-        db.flush()
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["date", "track_name", "state"],
+            set_={
+                "country": upsert.excluded.country,
+                "ra_meetcode": upsert.excluded.ra_meetcode,
+                "pf_meeting_id": func.coalesce(
+                    upsert.excluded.pf_meeting_id, models.Meeting.pf_meeting_id
+                ),
+            },
+        )
+        meeting = db.scalars(
+            upsert.returning(models.Meeting),
+            execution_options={"populate_existing": True},
+        ).one()
     else:
         # Update existing row in place
         meeting.country = m.country
         meeting.ra_meetcode = m.ra_meetcode
-        if m.pf_meeting_id is not None and meeting.pf_meeting_id != m.pf_meeting_id:
-            meeting.pf_meeting_id = m.pf_meeting_id
 
     # --- Create TipRun ---
     tr = payload.tip_run
@@ -135,71 +348,95 @@ def create_tips_batch(
     db.flush()
 
     # --- Upsert Races + create Tips ---
-    race_with_tips_out: list[schemas.RaceWithTipsOut] = []
-
+    # Collapse repeated race numbers first (later non-null fields win), since
+    # ON CONFLICT cannot touch the same row twice in one statement.
+    race_rows: dict[int, dict[str, Any]] = {}
     for race_in in payload.races:
         r = race_in.race
-
-        race = (
-            db.query(models.Race)
-            .filter(
-                models.Race.meeting_id == meeting.id,
-                models.Race.race_number == r.race_number,
-            )
-            .first()
+        row = race_rows.setdefault(
+            r.race_number,
+            {
+                "id": str(uuid.uuid4()),
+                "meeting_id": meeting.id,
+                "race_number": r.race_number,
+                "name": None,
+                "distance_m": None,
+                "class_text": None,
+                "scheduled_start": None,
+            },
         )
-
-        if not race:
-            race = models.Race(
-                meeting_id=meeting.id,
-                race_number=r.race_number,
-                name=r.name,
-                distance_m=r.distance_m,
-                class_text=r.class_text,
-                scheduled_start=r.scheduled_start,
-            )
-            db.add(race)
-            db.flush()
-        else:
-            # Light "upsert" update
-            if r.name is not None:
-                race.name = r.name
-            if r.distance_m is not None:
-                race.distance_m = r.distance_m
-            if r.class_text is not None:
-                race.class_text = r.class_text
-            if r.scheduled_start is not None:
-                race.scheduled_start = r.scheduled_start
-
-        tip_out_list: list[schemas.TipOut] = []
-
-        for t in race_in.tips:
-            tip = models.Tip(
-                race_id=race.id,
-                tip_run_id=tip_run.id,
-                tip_type=t.tip_type,
-                tab_number=t.tab_number,
-                horse_name=t.horse_name,
-                reasoning=t.reasoning,
-                stake_units=t.stake_units,
+        for field in ("name", "distance_m", "class_text", "scheduled_start"):
+            value = getattr(r, field)
+            if value is not None:
+                row[field] = value
+
+    races_by_number: dict[int, models.Race] = {}
+    if race_rows:
+        upsert = _dialect_insert(db, models.Race).values(list(race_rows.values()))
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["meeting_id", "race_number"],
+            # Light "upsert": only overwrite fields the payload actually sets.
+            set_={
+                field: func.coalesce(
+                    getattr(upsert.excluded, field), getattr(models.Race, field)
+                )
+                for field in ("name", "distance_m", "class_text", "scheduled_start")
+            },
+        )
+        races_by_number = {
+            race.race_number: race
+            for race in db.scalars(
+                upsert.returning(models.Race),
+                execution_options={"populate_existing": True},
             )
-            db.add(tip)
-            db.flush()
+        }
 
-            tip_out = schemas.TipOut.model_validate(tip)
-            tip_out_list.append(tip_out)
+    races_and_tips_in: list[tuple[models.Race, list[schemas.TipIn]]] = [
+        (races_by_number[race_in.race.race_number], race_in.tips)
+        for race_in in payload.races
+    ]
 
-        race_out = schemas.RaceOut.model_validate(race)
+    # --- Insert every tip for the meeting in one multi-row INSERT ... RETURNING ---
+    tip_rows = [
+        {
+            "race_id": race.id,
+            "tip_run_id": tip_run.id,
+            "tip_type": t.tip_type,
+            "tab_number": t.tab_number,
+            "horse_name": t.horse_name,
+            "reasoning": t.reasoning,
+            "stake_units": t.stake_units,
+        }
+        for race, tips_in in races_and_tips_in
+        for t in tips_in
+    ]
+    inserted_tips: list[models.Tip] = []
+    if tip_rows:
+        inserted_tips = list(
+            db.scalars(
+                insert(models.Tip).returning(models.Tip, sort_by_parameter_order=True),
+                tip_rows,
+            )
+        )
+
+    race_with_tips_out: list[schemas.RaceWithTipsOut] = []
+    offset = 0
+    for race, tips_in in races_and_tips_in:
+        race_tips = inserted_tips[offset:offset + len(tips_in)]
+        offset += len(tips_in)
         race_with_tips_out.append(
             schemas.RaceWithTipsOut(
-                race=race_out,
-                tips=tip_out_list,
+                race=_race_out(race),
+                tips=[_tip_out(tip) for tip in race_tips],
             )
         )
 
-    db.commit()
+    if commit:
+        db.commit()
+    else:
+        db.flush()
 
-    meeting_out = schemas.MeetingOut.model_validate(meeting)
+    meeting_out = _meeting_out(meeting)
 
     return schemas.MeetingTipsOut(
         meeting=meeting_out,
@@ -239,9 +476,9 @@ def generate_tips(
                 project_id=project_id,
             )
         except Exception as e:
-            print(
-                f"[iReel] error for {meeting.track_name} "
-                f"R{race_in.race_number}: {e}"
+            log.warning(
+                "[iReel] error for %s R%s: %s",
+                meeting.track_name, race_in.race_number, e,
             )
             tip_dicts = []
 
@@ -287,26 +524,20 @@ def cron_generate_daily_tips(
     explicitly via /cron/generate-meeting-tips.
     """
     target_date = date_type.fromisoformat(date_str)
-    print(f"[CRON] Generating tips for {target_date} (project_id={project_id})")
+    log.info("[CRON] Generating tips for %s (project_id=%s)", target_date, project_id)
 
     payloads = daily_generator.build_generate_tips_payloads_for_date(
     target_date=target_date,
     project_id=project_id,
     force_all_meetings=False,   # daily
-    )
-    print(f"[CRON] daily_generator returned {len(payloads)} meetings")
-
     # Optional: narrow to a single PF meeting (still respects M/P filtering
     # done in daily_generator).
-    if only_pf_meeting_id is not None:
-        payloads = [
-            p for p in payloads
-            if getattr(p.meeting, "pf_meeting_id", None) == only_pf_meeting_id
-        ]
-        print(
-            f"[CRON] after only_pf_meeting_id={only_pf_meeting_id}, "
-            f"{len(payloads)} meetings remain"
-        )
+    only_pf_meeting_id=only_pf_meeting_id,
+    )
+    log.info(
+        "[CRON] daily_generator returned %d meetings (only_pf_meeting_id=%s)",
+        len(payloads), only_pf_meeting_id,
+    )
 
     # Optionally skip some tracks by name
     if skip_tracks:
@@ -314,7 +545,10 @@ def cron_generate_daily_tips(
             p for p in payloads
             if getattr(p.meeting, "track_name", None) not in skip_tracks
         ]
-        print(f"[CRON] after skip_tracks={skip_tracks!r}, {len(payloads)} meetings remain")
+        log.info(
+            "[CRON] after skip_tracks=%r, %d meetings remain",
+            skip_tracks, len(payloads),
+        )
 
     meetings_processed = 0
     tip_runs_created = 0
@@ -322,94 +556,89 @@ def cron_generate_daily_tips(
     meetings_skipped = 0
     errors: list[dict[str, Any]] = []
 
+    # One query up front for every meeting that already has iReel tips,
+    # instead of a _meeting_has_tips round-trip per payload.
+    existing_pf, existing_nk = _meetings_with_tips(
+        db,
+        meeting_date=target_date,
+        pf_meeting_ids=[
+            p.meeting.pf_meeting_id
+            for p in payloads
+            if getattr(p.meeting, "pf_meeting_id", None) is not None
+        ],
+        source="iReel",
+    )
+
+    to_generate: list[schemas.GenerateTipsIn] = []
     for payload in payloads:
         meeting = payload.meeting
-        tip_run_in = payload.tip_run
+        pf_meeting_id = getattr(meeting, "pf_meeting_id", None)
 
         # Check if iReel tips already exist for this meeting - skip if so
-        if _meeting_has_tips(
-            db=db,
-            meeting_date=meeting.date,
-            track_name=meeting.track_name,
-            state=meeting.state,
-            pf_meeting_id=getattr(meeting, "pf_meeting_id", None),
-            source="iReel",
+        if (
+            (pf_meeting_id is not None and pf_meeting_id in existing_pf)
+            or (meeting.date, meeting.track_name, meeting.state) in existing_nk
         ):
-            print(
-                f"[CRON] SKIPPING {meeting.track_name} ({meeting.state}) on {meeting.date} "
-                f"- iReel tips already exist"
+            log.info(
+                "[CRON] SKIPPING %s (%s) on %s - iReel tips already exist",
+                meeting.track_name, meeting.state, meeting.date,
             )
             meetings_skipped += 1
             continue
 
-        races_entries: list[dict[str, Any]] = []
+        to_generate.append(payload)
 
-        for race_ctx in payload.races:
-            race_in = race_ctx.race
-            scratchings = race_ctx.scratchings or []
-            track_condition = race_ctx.track_condition
-
-            print(
-                f"[CRON] calling iReel for "
-                f"{getattr(meeting, 'track_name', meeting)} "
-                f"R{getattr(race_in, 'race_number', '?')}, "
-                f"scratchings={scratchings}, cond={track_condition!r}"
+    def _generate_meeting(payload):
+        return payload, _generate_ireel_race_entries(
+            meeting=payload.meeting,
+            race_ctxs=payload.races,
+            project_id=payload.tip_run.project_id,
+        )
+
+    # Meetings are independent, so their iReel calls run concurrently
+    # (bounded by CRON_MEETING_PARALLEL). Persistence stays on this thread
+    # and this session, consuming results in card order as they land.
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(CRON_MEETING_PARALLEL, len(to_generate)))
+    ) as executor:
+        for payload, races_entries in executor.map(_generate_meeting, to_generate):
+            meeting = payload.meeting
+
+            if not races_entries:
+                continue
+
+            tips_batch = schemas.TipsBatchIn(
+                meeting=meeting,
+                tip_run=payload.tip_run,
+                races=races_entries,
             )
 
+            # Each meeting runs in its own savepoint inside the sweep's single
+            # transaction: a failure rolls back just that meeting, and the whole
+            # sweep pays for one COMMIT at the end.
             try:
-                tip_dicts = ireel_client.generate_race_tips(
-                    meeting=meeting,
-                    race=race_in,
-                    scratchings=scratchings,
-                    track_condition=track_condition,
-                    project_id=tip_run_in.project_id,
-                )
+                with db.begin_nested():
+                    mt_out = _persist_tips_batch(db, tips_batch, commit=False)
             except Exception as e:
-                print(
-                    f"[CRON] iReel error for "
-                    f"{getattr(meeting, 'track_name', meeting)} "
-                    f"R{getattr(race_in, 'race_number', '?')}: {e}"
+                log.warning(
+                    "[CRON] create_tips_batch failed for %s (%s) on %s: %s",
+                    meeting.track_name, meeting.state, meeting.date, e,
+                )
+                errors.append(
+                    {
+                        "track_name": meeting.track_name,
+                        "state": meeting.state,
+                        "date": meeting.date.isoformat(),
+                        "error": repr(e),
+                    }
                 )
-                tip_dicts = []
-            finally:
-                # Play nice with iReel rate limits
-                time.sleep(1.0)
-
-            if not tip_dicts:
                 continue
 
-            races_entries.append({"race": race_in, "tips": tip_dicts})
+            meetings_processed += 1
+            tip_runs_created += 1
+            races_with_tips += len(mt_out.races)
 
-        if not races_entries:
-            continue
-
-        tips_batch = schemas.TipsBatchIn(
-            meeting=meeting,
-            tip_run=tip_run_in,
-            races=races_entries,
-        )
-
-        try:
-            mt_out = create_tips_batch(tips_batch, db=db)
-        except Exception as e:
-            print(
-                f"[CRON] create_tips_batch failed for "
-                f"{meeting.track_name} ({meeting.state}) on {meeting.date}: {e}"
-            )
-            db.rollback()
-            errors.append(
-                {
-                    "track_name": meeting.track_name,
-                    "state": meeting.state,
-                    "date": meeting.date.isoformat(),
-                    "error": repr(e),
-                }
-            )
-            continue
-
-        meetings_processed += 1
-        tip_runs_created += 1
-        races_with_tips += len(mt_out.races)
+    db.commit()
 
     return schemas.CronGenerateTipsOut(
         ok=True,
@@ -440,10 +669,10 @@ def cron_generate_meeting_tips(
     a specific meeting that isn't included in the default M/P sweep.
     """
     target_date = date_type.fromisoformat(date_str)
-    print(
-        f"[CRON] Generating tips for single meeting "
-        f"pf_meeting_id={pf_meeting_id} on {target_date} "
-        f"(project_id={project_id})"
+    log.info(
+        "[CRON] Generating tips for single meeting pf_meeting_id=%s on %s "
+        "(project_id=%s)",
+        pf_meeting_id, target_date, project_id,
     )
 
     # Build all payloads for the date, then pick the one with this pf_meeting_id.
@@ -454,9 +683,13 @@ def cron_generate_meeting_tips(
     target_date=target_date,
     project_id=project_id,
     force_all_meetings=True,    # manual /cron override
+    only_pf_meeting_id=pf_meeting_id,
     )
 
-    print(f"[CRON] daily_generator returned {len(payloads)} meetings for {target_date}")
+    log.info(
+        "[CRON] daily_generator returned %d meetings for %s",
+        len(payloads), target_date,
+    )
 
     payload = next(
         (p for p in payloads if getattr(p.meeting, "pf_meeting_id", None) == pf_meeting_id),
@@ -480,9 +713,9 @@ def cron_generate_meeting_tips(
         pf_meeting_id=getattr(meeting, "pf_meeting_id", None),
         source="iReel",
     ):
-        print(
-            f"[CRON] (single) SKIPPING {meeting.track_name} ({meeting.state}) "
-            f"on {meeting.date} - iReel tips already exist"
+        log.info(
+            "[CRON] (single) SKIPPING %s (%s) on %s - iReel tips already exist",
+            meeting.track_name, meeting.state, meeting.date,
         )
         raise HTTPException(
             status_code=409,
@@ -490,43 +723,12 @@ def cron_generate_meeting_tips(
         )
 
     tip_run_in = payload.tip_run
-    races_entries: list[dict[str, Any]] = []
-
-    for race_ctx in payload.races:
-        race_in = race_ctx.race
-        scratchings = race_ctx.scratchings or []
-        track_condition = race_ctx.track_condition
-
-        print(
-            f"[CRON] (single) calling iReel for "
-            f"{getattr(meeting, 'track_name', meeting)} "
-            f"R{getattr(race_in, 'race_number', '?')}, "
-            f"scratchings={scratchings}, cond={track_condition!r}"
-        )
-
-        try:
-            tip_dicts = ireel_client.generate_race_tips(
-                meeting=meeting,
-                race=race_in,
-                scratchings=scratchings,
-                track_condition=track_condition,
-                project_id=tip_run_in.project_id,
-            )
-        except Exception as e:
-            print(
-                f"[CRON] (single) iReel error for "
-                f"{getattr(meeting, 'track_name', meeting)} "
-                f"R{getattr(race_in, 'race_number', '?')}: {e}"
-            )
-            tip_dicts = []
-        finally:
-            # Play nice with iReel rate limits
-            time.sleep(1.0)
-
-        if not tip_dicts:
-            continue
-
-        races_entries.append({"race": race_in, "tips": tip_dicts})
+    races_entries = _generate_ireel_race_entries(
+        meeting=meeting,
+        race_ctxs=payload.races,
+        project_id=tip_run_in.project_id,
+        log_prefix="[CRON] (single)",
+    )
 
     if not races_entries:
         raise HTTPException(
@@ -558,9 +760,9 @@ def cron_generate_meeting_tips_gemini(
     injection as the iReel endpoint.
     """
     target_date = date_type.fromisoformat(date_str)
-    print(
-        f"[GEMINI] Generating tips for pf_meeting_id={pf_meeting_id} "
-        f"on {target_date}"
+    log.info(
+        "[GEMINI] Generating tips for pf_meeting_id=%s on %s",
+        pf_meeting_id, target_date,
     )
 
     # Build payloads (same as iReel — includes scratchings + conditions)
@@ -568,6 +770,7 @@ def cron_generate_meeting_tips_gemini(
         target_date=target_date,
         project_id="gemini",  # not used by Gemini, but required by schema
         force_all_meetings=True,
+        only_pf_meeting_id=pf_meeting_id,
     )
 
     payload = next(
@@ -592,9 +795,9 @@ def cron_generate_meeting_tips_gemini(
         pf_meeting_id=getattr(meeting, "pf_meeting_id", None),
         source="Gemini",
     ):
-        print(
-            f"[GEMINI] SKIPPING {meeting.track_name} ({meeting.state}) "
-            f"on {meeting.date} - Gemini tips already exist"
+        log.info(
+            "[GEMINI] SKIPPING %s (%s) on %s - Gemini tips already exist",
+            meeting.track_name, meeting.state, meeting.date,
         )
         raise HTTPException(
             status_code=409,
@@ -614,9 +817,9 @@ def cron_generate_meeting_tips_gemini(
         track_condition = race_ctx.track_condition
         race_num = getattr(race_in, "race_number", "?")
 
-        print(
-            f"[GEMINI] Generating tips for {meeting.track_name} "
-            f"R{race_num}, scratchings={scratchings}, cond={track_condition!r}"
+        log.info(
+            "[GEMINI] Generating tips for %s R%s, scratchings=%s, cond=%r",
+            meeting.track_name, race_num, scratchings, track_condition,
         )
 
         try:
@@ -627,7 +830,7 @@ def cron_generate_meeting_tips_gemini(
                 track_condition=track_condition,
             )
         except Exception as e:
-            print(f"[GEMINI] Error for {meeting.track_name} R{race_num}: {e}")
+            log.warning("[GEMINI] Error for %s R%s: %s", meeting.track_name, race_num, e)
             tip_dicts = []
 
         return race_in, tip_dicts
@@ -702,7 +905,7 @@ def cron_sweep_gemini_tips(
     pipeline.
     """
     target_date = date_type.fromisoformat(date_str)
-    print(f"[SWEEP] Gemini sweep for {target_date} (force_all={force_all})")
+    log.info("[SWEEP] Gemini sweep for %s (force_all=%s)", target_date, force_all)
 
     payloads = daily_generator.build_generate_tips_payloads_for_date(
         target_date=target_date,
@@ -771,9 +974,9 @@ def cron_sweep_gemini_tips(
         if not missing_race_ctxs:
             continue
 
-        print(
-            f"[SWEEP] {meeting_in.track_name} ({meeting_in.state}): "
-            f"{len(missing_race_ctxs)} race(s) missing Gemini tips"
+        log.info(
+            "[SWEEP] %s (%s): %d race(s) missing Gemini tips",
+            meeting_in.track_name, meeting_in.state, len(missing_race_ctxs),
         )
 
         def _generate_one(ctx):
@@ -940,9 +1143,7 @@ def _fetch_clone_picks_for_meeting(
 
     Returns {race_number: [{tab_number, horse_name, role, clone_price}]}
     """
-    import httpx
-
-    resp = httpx.get(
+    resp = http_client.get(
         CLONE_API_URL,
         params={"date": target_date.isoformat()},
         timeout=30.0,
@@ -1001,9 +1202,9 @@ def cron_generate_meeting_tips_clone(
     3. Store tips with source="Clone"
     """
     target_date = date_type.fromisoformat(date_str)
-    print(
-        f"[CLONE] Generating tips for pf_meeting_id={pf_meeting_id} "
-        f"on {target_date}"
+    log.info(
+        "[CLONE] Generating tips for pf_meeting_id=%s on %s",
+        pf_meeting_id, target_date,
     )
 
     # Fetch clone picks
@@ -1026,13 +1227,14 @@ def cron_generate_meeting_tips_clone(
             ),
         )
 
-    print(f"[CLONE] Got clone picks for {len(clone_picks_by_race)} races")
+    log.info("[CLONE] Got clone picks for %d races", len(clone_picks_by_race))
 
     # Build payloads (for scratchings + conditions + meeting metadata)
     payloads = daily_generator.build_generate_tips_payloads_for_date(
         target_date=target_date,
         project_id="clone",
         force_all_meetings=True,
+        only_pf_meeting_id=pf_meeting_id,
     )
 
     payload = next(
@@ -1080,9 +1282,9 @@ def cron_generate_meeting_tips_clone(
 
         clone_picks = clone_picks_by_race.get(race_number)
         if not clone_picks:
-            print(
-                f"[CLONE] No clone picks for {meeting.track_name} "
-                f"R{race_number}, skipping"
+            log.info(
+                "[CLONE] No clone picks for %s R%s, skipping",
+                meeting.track_name, race_number,
             )
             continue
 
@@ -1093,20 +1295,22 @@ def cron_generate_meeting_tips_clone(
             if p["tab_number"] not in scratched_set
         ]
         if len(clone_picks) < 3:
-            print(
-                f"[CLONE] Clone pick scratched in {meeting.track_name} "
-                f"R{race_number}, skipping"
+            log.info(
+                "[CLONE] Clone pick scratched in %s R%s, skipping",
+                meeting.track_name, race_number,
             )
             continue
 
-        print(
-            f"[CLONE] {meeting.track_name} R{race_number}: "
-            f"Best=#{clone_picks[0]['tab_number']} "
-            f"{clone_picks[0]['horse_name']}, "
-            f"Danger=#{clone_picks[1]['tab_number']} "
-            f"{clone_picks[1]['horse_name']}, "
-            f"Value=#{clone_picks[2]['tab_number']} "
-            f"{clone_picks[2]['horse_name']}"
+        log.info(
+            "[CLONE] %s R%s: Best=#%s %s, Danger=#%s %s, Value=#%s %s",
+            meeting.track_name,
+            race_number,
+            clone_picks[0]["tab_number"],
+            clone_picks[0]["horse_name"],
+            clone_picks[1]["tab_number"],
+            clone_picks[1]["horse_name"],
+            clone_picks[2]["tab_number"],
+            clone_picks[2]["horse_name"],
         )
 
         try:
@@ -1118,9 +1322,9 @@ def cron_generate_meeting_tips_clone(
                 clone_picks=clone_picks,
             )
         except Exception as e:
-            print(
-                f"[CLONE] Error for {meeting.track_name} "
-                f"R{race_number}: {e}"
+            log.warning(
+                "[CLONE] Error for %s R%s: %s",
+                meeting.track_name, race_number, e,
             )
             tip_dicts = []
 
@@ -1156,6 +1360,10 @@ def cron_generate_meeting_tips_clone(
     return create_tips_batch(tips_batch, db=db)
 
 
+# Rows per fetch when streaming the /tips join.
+LIST_TIPS_YIELD_PER = 500
+
+
 @router.get("/tips", response_model=list[schemas.MeetingTipsOut])
 def list_tips(
     response: Response,
@@ -1183,13 +1391,36 @@ def list_tips(
     # are added later in the day.
     response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
     response.headers["Pragma"] = "no-cache"
-    q = db.query(models.TipRun).join(models.Meeting)
-    q = q.filter(models.Meeting.date == meeting_date)
+    # One flat TipRun × Meeting × Race × Tip join, grouped in Python below.
+    # Only races that actually carry tips from the run come back.
+    q = (
+        select(models.TipRun, models.Meeting, models.Race, models.Tip)
+        .join(models.Meeting, models.TipRun.meeting_id == models.Meeting.id)
+        .join(models.Race, models.Race.meeting_id == models.Meeting.id)
+        .join(
+            models.Tip,
+            and_(
+                models.Tip.tip_run_id == models.TipRun.id,
+                models.Tip.race_id == models.Race.id,
+            ),
+        )
+        .where(models.Meeting.date == meeting_date)
+        # Runs in creation order (TipRun.id is a random uuid, so it only
+        # breaks ties); tips keep their insertion order within a race.
+        .order_by(
+            models.TipRun.created_at,
+            models.TipRun.id,
+            models.Race.race_number,
+            models.Race.id,
+            models.Tip.created_at,
+            models.Tip.id,
+        )
+    )
 
     if track_name:
-        q = q.filter(models.Meeting.track_name == track_name)
+        q = q.where(models.Meeting.track_name == track_name)
     if state:
-        q = q.filter(models.Meeting.state == state)
+        q = q.where(models.Meeting.state == state)
 
     # Gemini outage alias: if settings.gemini_alias_source is set, rewrite
     # incoming ?source=Gemini requests to the alias target (e.g. "iReel").
@@ -1206,13 +1437,12 @@ def list_tips(
     # (env var TIPS_DEFAULT_SOURCE). Apps can override with ?source=iReel,
     # ?source=Gemini, or ?source=all.
     if source is not None and source.lower() != "all":
-        q = q.filter(models.TipRun.source == source)
-        tip_runs = q.all()
-    elif source is not None and source.lower() == "all":
-        tip_runs = q.all()
-    else:
-        q = q.filter(models.TipRun.source == settings.tips_default_source)
-        tip_runs = q.all()
+        q = q.where(models.TipRun.source == source)
+    elif source is None:
+        q = q.where(models.TipRun.source == settings.tips_default_source)
+    # Stream the join in batches (server-side cursor on Postgres) rather than
+    # materialising every row up front; groupby below consumes it lazily.
+    rows = db.execute(q.execution_options(yield_per=LIST_TIPS_YIELD_PER))
     results: list[schemas.MeetingTipsOut] = []
 
     # Backfill any missing pf_meeting_id from PF's authoritative meetingslist.
@@ -1224,8 +1454,10 @@ def list_tips(
     resolver_map: dict | None = None
     healed_meeting_ids: set = set()
 
-    for tr in tip_runs:
-        meeting = tr.meeting
+    for _, run_rows in groupby(rows, key=lambda row: row.TipRun.id):
+        run_rows = list(run_rows)
+        tr = run_rows[0].TipRun
+        meeting = run_rows[0].Meeting
 
         if meeting.pf_meeting_id is None and meeting.id not in healed_meeting_ids:
             if resolver_map is None:
@@ -1236,21 +1468,22 @@ def list_tips(
             if resolved is not None:
                 meeting.pf_meeting_id = resolved
                 healed_meeting_ids.add(meeting.id)
-                print(
-                    f"[PFRESOLVE] backfilled pf_meeting_id={resolved} for "
-                    f"{meeting.track_name} ({meeting.state}) on {meeting_date}"
+                log.info(
+                    "[PFRESOLVE] backfilled pf_meeting_id=%s for %s (%s) on %s",
+                    resolved, meeting.track_name, meeting.state, meeting_date,
                 )
 
         races_with_tips: list[schemas.RaceWithTipsOut] = []
 
-        for race in meeting.races:
-            race_tips = [t for t in tr.tips if t.race_id == race.id]
-            if not race_tips:
-                continue
-
-            race_out = schemas.RaceOut.model_validate(race)
+        for _, race_rows in groupby(run_rows, key=lambda row: row.Race.id):
+            race_rows = list(race_rows)
+            race_out = _RACE_ADAPTER.validate_python(
+                race_rows[0].Race, from_attributes=True
+            )
             race_out.pf_meeting_id = meeting.pf_meeting_id
-            tip_outs = [schemas.TipOut.model_validate(t) for t in race_tips]
+            tip_outs = _TIPS_ADAPTER.validate_python(
+                [row.Tip for row in race_rows], from_attributes=True
+            )
 
             races_with_tips.append(
                 schemas.RaceWithTipsOut(
@@ -1259,15 +1492,14 @@ def list_tips(
                 )
             )
 
-        if races_with_tips:
-            meeting_out = schemas.MeetingOut.model_validate(meeting)
-            results.append(
-                schemas.MeetingTipsOut(
-                    meeting=meeting_out,
-                    tip_run_id=tr.id,
-                    races=races_with_tips,
-                )
+        meeting_out = _MEETING_ADAPTER.validate_python(meeting, from_attributes=True)
+        results.append(
+            schemas.MeetingTipsOut(
+                meeting=meeting_out,
+                tip_run_id=tr.id,
+                races=races_with_tips,
             )
+        )
 
     # Persist backfilled pf_meeting_id so future reads (and stats joins) are
     # clean. Best-effort: never fail the response if the write can't commit —
@@ -1277,7 +1509,7 @@ def list_tips(
             db.commit()
         except Exception as e:  # noqa: BLE001
             db.rollback()
-            print(f"[PFRESOLVE] persist failed (response still ok): {e}")
+            log.warning("[PFRESOLVE] persist failed (response still ok): %s", e)
 
     return results
 
@@ -1311,7 +1543,10 @@ def edit_tip(
     db.commit()
     db.refresh(tip)
 
-    print(f"[TIPS] Updated tip {tip_id}: {tip.tip_type} #{tip.tab_number} {tip.horse_name}")
+    log.info(
+        "[TIPS] Updated tip %s: %s #%s %s",
+        tip_id, tip.tip_type, tip.tab_number, tip.horse_name,
+    )
 
     return schemas.TipOut.model_validate(tip)
 
@@ -1333,6 +1568,6 @@ def delete_tip(
     db.delete(tip)
     db.commit()
 
-    print(f"[TIPS] Deleted tip {tip_id}: {tip_info}")
+    log.info("[TIPS] Deleted tip %s: %s", tip_id, tip_info)
 
     return {"ok": True, "deleted": tip_id}
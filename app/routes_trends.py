@@ -5,17 +5,23 @@ Routes for trend analysis dashboard and API endpoints.
 from __future__ import annotations
 
 from datetime import date as date_type, timedelta
+from functools import lru_cache
 
 from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.orm import Session
 
 from .database import get_db
+from .ui_helpers import templates
 from .trends_analytics import compute_trends
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+
+
+@lru_cache(maxsize=512)
+def _fmt_date(d: date_type) -> str:
+    """Dashboard date label, e.g. '05 Jan 2026'."""
+    return d.strftime("%d %b %Y")
 
 
 @router.get("/api/trends")
@@ -76,7 +82,7 @@ def ui_trends(
         source=source,
     )
 
-    display_range = f"{from_date.strftime('%d %b %Y')} - {to_date.strftime('%d %b %Y')}"
+    display_range = f"{_fmt_date(from_date)} - {_fmt_date(to_date)}"
 
     return templates.TemplateResponse(
         "trends.html",
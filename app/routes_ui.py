@@ -1,13 +1,19 @@
 # app/routes_ui.py
+import logging
 import re
+import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date as date_type
-from typing import Any, Optional, Dict, List, Tuple
+from typing import Any, NamedTuple, Optional, Dict, Tuple
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.responses import HTMLResponse
 from starlette.requests import Request
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, contains_eager, defaultload, raiseload
 
+from .config import settings
 from .database import get_db
 from . import models
 from .daily_generator import today_mel
@@ -17,10 +23,47 @@ from .ui_helpers import (
     display_reason,
     format_pretty_date,
 )
-from .ra_results_client import RAResultsClient  # 👈 NEW
+from .ra_results_client import fetch_results_for_date_cached
 
 router = APIRouter()
 
+log = logging.getLogger(__name__)
+
+# Runs the RA crawler fetch for a day page while the request thread does
+# its DB queries.
+_ra_prefetch_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ui-ra")
+
+
+@dataclass(slots=True)
+class TipRow:
+    """One tip as rendered on the day pages (templates read it by attribute)."""
+    id: str
+    tip_type: str
+    tab_number: int
+    horse: str
+    stake: float
+    placing: Optional[int]
+    result: Optional[str]
+    sp: Optional[float]
+    trainer: Optional[str]
+    jockey: Optional[str]
+    tip: models.Tip = field(repr=False)
+
+    @property
+    def reason(self) -> str:
+        # Cleaned lazily: none of the day templates currently show it.
+        return display_reason(self.tip)
+
+
+class _RAStub(NamedTuple):
+    """RA crawler result standing in for a RaceResult in the day-page index."""
+    finish_position: Optional[int]
+    starting_price: Optional[float]
+    provider: str
+    trainer: Optional[str] = None
+    jockey: Optional[str] = None
+
+
 def _classify_outcome(pos_fin: Optional[int]) -> str:
     """
     Simple WIN/PLACE/LOSE classifier based on finishing position.
@@ -46,13 +89,43 @@ def _build_day_page_context(
     """
     STAKE_PER_UNIT = 10.0  # $10 per stake unit
 
+    # Kick off the RA results fetch now; it's only needed at step 2b.
+    ra_future = _ra_prefetch_pool.submit(fetch_results_for_date_cached, meeting_date)
+
     # -----------------------
     # 1) All tip runs for this date
     # -----------------------
-    q = db.query(models.TipRun).join(models.Meeting)
+    # One joined statement brings back each run's meeting, tips, and any
+    # TipOutcome (+ its RaceResult); races follow in a single selectin load.
+    q = (
+        db.query(models.TipRun)
+        .join(models.Meeting)
+        .outerjoin(models.Tip, models.Tip.tip_run_id == models.TipRun.id)
+        .outerjoin(models.TipOutcome, models.TipOutcome.tip_id == models.Tip.id)
+        .outerjoin(
+            models.RaceResult,
+            models.TipOutcome.race_result_id == models.RaceResult.id,
+        )
+        .options(
+            contains_eager(models.TipRun.meeting).selectinload(models.Meeting.races),
+            contains_eager(models.TipRun.tips)
+            .contains_eager(models.Tip.outcome)
+            .contains_eager(models.TipOutcome.race_result),
+        )
+    )
+    if settings.sql_raiseload:
+        # Anything not eager-loaded above must not trigger a per-row SELECT.
+        q = q.options(
+            raiseload("*", sql_only=True),
+            defaultload(models.TipRun.meeting).raiseload("*", sql_only=True),
+            defaultload(models.TipRun.meeting)
+            .defaultload(models.Meeting.races)
+            .raiseload("*", sql_only=True),
+            defaultload(models.TipRun.tips).raiseload("*", sql_only=True),
+        )
     q = q.filter(models.Meeting.date == meeting_date)
     tip_runs = q.all()
-    print(f"[UI] tip_runs for {meeting_date}: {len(tip_runs)}")
+    log.debug("[UI] tip_runs for %s: %d", meeting_date, len(tip_runs))
 
     # -----------------------
     # 2) Build RaceResult index for this date
@@ -69,27 +142,36 @@ def _build_day_page_context(
         .filter(models.Meeting.date == meeting_date)
         .all()
     )
-    print(f"[UI] raw RaceResult rows for {meeting_date}: {len(rr_rows)}")
+    log.debug("[UI] raw RaceResult rows for %s: %d", meeting_date, len(rr_rows))
+
+    # Normalise each meeting's (track, state) once, not once per result row.
+    meeting_norm: dict[str, tuple[str, str]] = {}
+
+    # Bound-method locals for the per-row loops below.
+    meeting_norm_get = meeting_norm.get
+    rri_get = race_results_index.get
 
     for rr, race, meeting in rr_rows:
-        track = (meeting.track_name or "").strip()
-        state = (meeting.state or "").strip().upper()
-        key = (track, state, race.race_number, rr.tab_number)
+        norm = meeting_norm_get(meeting.id)
+        if norm is None:
+            norm = meeting_norm[meeting.id] = (
+                sys.intern((meeting.track_name or "").strip()),
+                sys.intern((meeting.state or "").strip().upper()),
+            )
+        key = norm + (race.race_number, rr.tab_number)
 
-        existing = race_results_index.get(key)
-        if existing is None:
+        # First result wins, except a PF row replaces a non-PF one.
+        existing = rri_get(key)
+        if existing is None or (existing.provider != "PF" and rr.provider == "PF"):
             race_results_index[key] = rr
-        else:
-            # Prefer PF over RA/other providers
-            if getattr(existing, "provider", None) != "PF" and rr.provider == "PF":
-                race_results_index[key] = rr
-
-    print(f"[UI] race_results_index size (PF/DB) = {len(race_results_index)}")
-    for k, v in list(race_results_index.items())[:10]:
-        print(
-            f"[UI] RR index sample {k} -> "
-            f"pos={v.finish_position}, sp={v.starting_price}, provider={v.provider}"
-        )
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("[UI] race_results_index size (PF/DB) = %d", len(race_results_index))
+        for k, v in list(race_results_index.items())[:10]:
+            log.debug(
+                "[UI] RR index sample %s -> pos=%s, sp=%s, provider=%s",
+                k, v.finish_position, v.starting_price, v.provider,
+            )
 
     # -----------------------
     # 2b) Supplement index with RA Crawler /results for this date
@@ -97,94 +179,83 @@ def _build_day_page_context(
     # -----------------------
     ra_rows = []
     try:
-        ra_client = RAResultsClient()
-        try:
-            ra_rows = ra_client.fetch_results_for_date(meeting_date)
-            print(f"[UI] RAResultsClient rows for {meeting_date}: {len(ra_rows)}")
-        finally:
-            ra_client.close()
+        ra_rows = ra_future.result()
+        log.debug("[UI] RAResultsClient rows for %s: %d", meeting_date, len(ra_rows))
     except Exception as e:
-        print(f"[UI] error fetching RA results for {meeting_date}: {e}")
+        log.warning("[UI] error fetching RA results for %s: %s", meeting_date, e)
         ra_rows = []
 
-    class _RAStub:
-        __slots__ = ("finish_position", "starting_price", "provider", "trainer", "jockey")
-
-        def __init__(self, finish_position, starting_price, provider: str, trainer=None, jockey=None):
-            self.finish_position = finish_position
-            self.starting_price = starting_price
-            self.provider = provider
-            self.trainer = trainer
-            self.jockey = jockey
-
     # Also build a trainer/jockey index from RA data
     trainer_jockey_index: dict[tuple, dict[str, str]] = {}
 
     for ra in ra_rows:
-        track = (ra.track or "").strip()
-        state = (ra.state or "").strip().upper()
-        key = (track, state, ra.race_no, ra.tab_number)
+        # RAResultsClient already strips / upper-cases track and state.
+        key = (ra.track, ra.state, ra.race_no, ra.tab_number)
+        trainer = ra.trainer
+        jockey = ra.jockey
 
         # Store trainer/jockey for all RA rows
         trainer_jockey_index[key] = {
-            "trainer": ra.trainer,
-            "jockey": ra.jockey,
+            "trainer": trainer,
+            "jockey": jockey,
         }
 
         # Never override an existing result (especially PF)
-        if key in race_results_index:
+        if rri_get(key) is not None:
             continue
 
         race_results_index[key] = _RAStub(
             finish_position=ra.finishing_pos,
             starting_price=ra.starting_price,
             provider="RA",
-            trainer=ra.trainer,
-            jockey=ra.jockey,
+            trainer=trainer,
+            jockey=jockey,
         )
 
-    print(f"[UI] race_results_index size after RA fallback = {len(race_results_index)}")
-    for k, v in list(race_results_index.items())[:10]:
-        print(
-            f"[UI] RR+RA index sample {k} -> "
-            f"pos={v.finish_position}, sp={v.starting_price}, provider={v.provider}"
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug(
+            "[UI] race_results_index size after RA fallback = %d",
+            len(race_results_index),
         )
+        for k, v in list(race_results_index.items())[:10]:
+            log.debug(
+                "[UI] RR+RA index sample %s -> pos=%s, sp=%s, provider=%s",
+                k, v.finish_position, v.starting_price, v.provider,
+            )
 
     # -----------------------
-    # 3) Pull any TipOutcome rows for these tips
+    # 3) TipOutcome rows for these tips (already loaded with the tip runs)
     # -----------------------
-    tip_ids: list[str] = [t.id for tr in tip_runs for t in tr.tips]
     outcomes_by_tip_id: dict[str, dict[str, Any]] = {}
-    print(f"[UI] total tips for {meeting_date}: {len(tip_ids)}")
-
-    if tip_ids:
-        rows = (
-            db.query(models.TipOutcome, models.RaceResult)
-            .outerjoin(
-                models.RaceResult,
-                models.TipOutcome.race_result_id == models.RaceResult.id,
-            )
-            .filter(models.TipOutcome.tip_id.in_(tip_ids))
-            .all()
-        )
-        print(f"[UI] TipOutcome rows fetched: {len(rows)}")
+    n_tips = 0
+
+    for tr in tip_runs:
+        for tip in tr.tips:
+            n_tips += 1
+            outcome = tip.outcome
+            if outcome is None:
+                continue
+            rr = outcome.race_result
 
-        for outcome, rr in rows:
             placing = outcome.finish_position or (rr.finish_position if rr else None)
             sp_src = outcome.starting_price or (rr.starting_price if rr else None)
             sp_val = float(sp_src) if sp_src is not None else None
 
-            outcomes_by_tip_id[outcome.tip_id] = {
+            outcomes_by_tip_id[tip.id] = {
                 "placing": placing,
                 "result": outcome.outcome_status,
                 "sp": sp_val,
             }
 
+    log.debug("[UI] total tips for %s: %d", meeting_date, n_tips)
+    log.debug("[UI] TipOutcome rows fetched: %d", len(outcomes_by_tip_id))
+
     # -----------------------
     # 4) Build meeting → races → tips structure for template
     #    and compute meeting + day summaries.
     # -----------------------
     meetings_data: list[dict[str, Any]] = []
+    debug_enabled = log.isEnabledFor(logging.DEBUG)
 
     day_totals = {
         "tips": 0,
@@ -213,22 +284,28 @@ def _build_day_page_context(
             "trifectas": 0,
         }
 
+        # Bucket this run's tips by race in one pass; one sort orders every
+        # bucket by (tip_type, tab_number).
+        tips_by_race: dict[str, list[models.Tip]] = defaultdict(list)
+        for t in sorted(tr.tips, key=lambda t: (t.tip_type, t.tab_number)):
+            tips_by_race[t.race_id].append(t)
+
         # Only include races that actually have tips for this TipRun
         for race in sorted(meeting.races, key=lambda r: r.race_number):
-            race_tips = [t for t in tr.tips if t.race_id == race.id]
+            race_tips = tips_by_race.get(race.id)
             if not race_tips:
                 continue
 
-            tips_rows: list[dict[str, Any]] = []
+            tips_rows: list[TipRow] = []
+            race_key_prefix = (mt_track, mt_state, race.race_number)
 
             # For quinella & trifecta detection
             ai_best_placing: Optional[int] = None
             danger_placing: Optional[int] = None
             value_placing: Optional[int] = None
 
-            for tip in sorted(race_tips, key=lambda t: (t.tip_type, t.tab_number)):
+            for tip in race_tips:
                 horse = display_horse_name(tip)
-                reasoning = display_reason(tip)
 
                 # Start with TipOutcome if present
                 outcome = outcomes_by_tip_id.get(tip.id, {})
@@ -237,7 +314,7 @@ def _build_day_page_context(
                 sp = outcome.get("sp")
 
                 # Fallback: look up by metadata key in RaceResult index
-                rr_key = (mt_track, mt_state, race.race_number, tip.tab_number)
+                rr_key = race_key_prefix + (tip.tab_number,)
                 rr = race_results_index.get(rr_key)
                 debug_hit = rr is not None
 
@@ -270,13 +347,15 @@ def _build_day_page_context(
                 elif tip.tip_type == "VALUE":
                     value_placing = placing
 
-                print(
-                    f"[UI] tip {mt_track} {mt_state} R{race.race_number} "
-                    f"TAB #{tip.tab_number}: "
-                    f"TO={'Y' if tip.id in outcomes_by_tip_id else 'N'}, "
-                    f"RR={'Y' if debug_hit else 'N'}, "
-                    f"placing={placing}, result={result}, sp={sp}"
-                )
+                if debug_enabled:
+                    log.debug(
+                        "[UI] tip %s %s R%s TAB #%s: TO=%s, RR=%s, "
+                        "placing=%s, result=%s, sp=%s",
+                        mt_track, mt_state, race.race_number, tip.tab_number,
+                        "Y" if tip.id in outcomes_by_tip_id else "N",
+                        "Y" if debug_hit else "N",
+                        placing, result, sp,
+                    )
 
                 # Get trainer/jockey from index
                 tj_data = trainer_jockey_index.get(rr_key, {})
@@ -293,61 +372,47 @@ def _build_day_page_context(
                     jockey = re.sub(r"\s*\([^)]*\)\s*$", "", jockey).strip()
 
                 tips_rows.append(
-                    {
-                        "id": tip.id,
-                        "tip_type": tip.tip_type,
-                        "tab_number": tip.tab_number,
-                        "horse": horse,
-                        "reason": reasoning,
-                        "stake": float(units),
-                        "placing": placing,   # ← maps finish_position
-                        "result": result,     # ← WIN/PLACE/LOSE
-                        "sp": sp,             # ← starting_price
-                        "trainer": trainer,   # ← trainer name
-                        "jockey": jockey,     # ← jockey name
-                    }
+                    TipRow(
+                        id=tip.id,
+                        tip_type=tip.tip_type,
+                        tab_number=tip.tab_number,
+                        horse=horse,
+                        stake=float(units),
+                        placing=placing,   # ← maps finish_position
+                        result=result,     # ← WIN/PLACE/LOSE
+                        sp=sp,             # ← starting_price
+                        trainer=trainer,   # ← trainer name
+                        jockey=jockey,     # ← jockey name
+                        tip=tip,
+                    )
                 )
 
+            # Bit n set <=> one of AI_BEST / DANGER / VALUE finished n-th (n = 1..3)
+            podium_mask = 0
+            for p in (ai_best_placing, danger_placing, value_placing):
+                if p is not None and 0 < p <= 3:
+                    podium_mask |= 1 << p
+
             # Quinella: any two of AI_BEST / DANGER / VALUE run 1st & 2nd (any order)
-            placings_for_quinella: List[int] = []
-            if ai_best_placing is not None:
-                placings_for_quinella.append(ai_best_placing)
-            if danger_placing is not None:
-                placings_for_quinella.append(danger_placing)
-            if value_placing is not None:
-                placings_for_quinella.append(value_placing)
-
-            has_quinella = False
-            if 1 in placings_for_quinella and 2 in placings_for_quinella:
-                has_quinella = True
+            has_quinella = (podium_mask & 0b0110) == 0b0110
+            if has_quinella:
                 mt_stats["quinellas"] += 1
 
             # Trifecta: AI_BEST, DANGER & VALUE fill 1st/2nd/3rd in any order
-            has_trifecta = False
-            if (
-                ai_best_placing is not None
-                and danger_placing is not None
-                and value_placing is not None
-            ):
-                trifecta_positions = {
-                    ai_best_placing,
-                    danger_placing,
-                    value_placing,
-                }
-                # Require exactly 1,2,3 as a set
-                if trifecta_positions == {1, 2, 3}:
-                    has_trifecta = True
-                    mt_stats["trifectas"] += 1
+            # (three picks can only set all three bits by filling each place once)
+            has_trifecta = podium_mask == 0b1110
+            if has_trifecta:
+                mt_stats["trifectas"] += 1
 
             # Build exotics order: sorted list of (placing, tip_type, horse) for Jam's Data
             exotics_order = []
             for tip_row in tips_rows:
-                if tip_row["placing"] is not None and tip_row["placing"] <= 3:
+                if tip_row.placing is not None and tip_row.placing <= 3:
                     exotics_order.append({
-                        "placing": tip_row["placing"],
-                        "tip_type": tip_row["tip_type"],
-                        "horse": tip_row["horse"],
-                        "tab_number": tip_row["tab_number"],
+                        "placing": tip_row.placing,
+                        "tip_type": tip_row.tip_type,
+                        "horse": tip_row.horse,
+                        "tab_number": tip_row.tab_number,
                     })
             exotics_order.sort(key=lambda x: x["placing"])
 
@@ -375,7 +440,7 @@ def _build_day_page_context(
             for race_data in last_4_races:
                 # Check if any tip in this race won (placing == 1)
                 race_has_winner = any(
-                    t.get("placing") == 1 for t in race_data.get("tips", [])
+                    t.placing == 1 for t in race_data.get("tips", [])
                 )
                 if race_has_winner:
                     quaddie_legs += 1
@@ -405,11 +470,11 @@ def _build_day_page_context(
             "quaddie_legs": quaddie_legs,
         }
 
-        print(
-            f"[UI] MEETING {meeting.track_name} {meeting.state}: "
-            f"tips={mt_tips}, wins={mt_wins}, strike%={mt_strike:.1f}, "
-            f"turnover={mt_turnover:.0f}, return={mt_return:.0f}, pnl={mt_pnl:.0f}, "
-            f"quinellas={mt_quin}, trifectas={mt_trif}"
+        log.debug(
+            "[UI] MEETING %s %s: tips=%d, wins=%d, strike%%=%.1f, "
+            "turnover=%.0f, return=%.0f, pnl=%.0f, quinellas=%d, trifectas=%d",
+            meeting.track_name, meeting.state, mt_tips, mt_wins, mt_strike,
+            mt_turnover, mt_return, mt_pnl, mt_quin, mt_trif,
         )
 
         # Roll up into day totals
@@ -458,12 +523,12 @@ def _build_day_page_context(
         "quaddies": day_totals["quaddies"],
     }
 
-    print(
-        f"[UI] DAY {meeting_date}: tips={day_summary['tips']}, "
-        f"wins={day_summary['wins']}, strike%={day_strike:.1f}, "
-        f"turnover={day_turnover:.0f}, return={day_return:.0f}, pnl={day_pnl:.0f}, "
-        f"quinellas={day_summary['quinellas']}, "
-        f"trifectas={day_summary['trifectas']}"
+    log.debug(
+        "[UI] DAY %s: tips=%d, wins=%d, strike%%=%.1f, turnover=%.0f, "
+        "return=%.0f, pnl=%.0f, quinellas=%d, trifectas=%d",
+        meeting_date, day_summary["tips"], day_summary["wins"], day_strike,
+        day_turnover, day_return, day_pnl,
+        day_summary["quinellas"], day_summary["trifectas"],
     )
 
     return {
@@ -1,23 +1,83 @@
 # app/routes_ui_overview.py
 from __future__ import annotations
 
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+from heapq import heappush, heapreplace
+from operator import itemgetter
 from decimal import Decimal
 from typing import Optional, Dict, Any, List, Tuple, Set
 
 from fastapi import APIRouter, Depends, Query, Request
-from fastapi.responses import HTMLResponse, JSONResponse
-from fastapi.templating import Jinja2Templates
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from sqlalchemy import and_, case, func
 from sqlalchemy.orm import Session
 from zoneinfo import ZoneInfo
 
 from .database import get_db
+from .ui_helpers import templates
 from .models import Meeting, Race, Tip, TipOutcome, TipRun
-from .ra_results_client import RAResultsClient
+from .ra_results_client import fetch_results_for_date_cached
 from .daily_generator import _tracks_match  # reuse the same fuzzy track matcher
 
 router = APIRouter()
-templates = Jinja2Templates(directory="templates")
+log = logging.getLogger(__name__)
+
+# Rows per batch when streaming the overview's tip window.
+OVERVIEW_YIELD_PER = 1000
+
+# Max concurrent per-day RA results fetches for a window.
+RA_FETCH_PARALLEL = 8
+
+# (wins, places) added to a bucket per tip status; anything else adds nothing.
+_STATUS_DELTAS: Dict[str, Tuple[int, int]] = {"WIN": (1, 1), "PLACE": (0, 1)}
+_NO_DELTA = (0, 0)
+
+# Max tip ids per IN (...) when looking up fallback TipOutcome rows.
+OUTCOME_IN_BATCH = 500
+
+# tip_type values (lower-cased) that count towards "AI Best" wins.
+AI_BEST_LABELS = frozenset({"best", "ai_best", "ai best", "ai-best"})
+
+
+# Whole overview payloads for windows that end before today, keyed by
+# (date_from, date_to, source). Bounded; oldest entry is evicted first.
+_OVERVIEW_CACHE_TTL_SECONDS = 60 * 60
+_OVERVIEW_CACHE_MAX_ENTRIES = 64
+PAST_WINDOW_MAX_AGE = 60 * 60
+CURRENT_WINDOW_MAX_AGE = 30
+
+_overview_cache: Dict[Tuple[date, date, Optional[str]], Tuple[float, Tuple[Dict[str, Any], int, str]]] = {}
+_overview_cache_lock = threading.Lock()
+
+
+def _get_cached_overview(key: Tuple[date, date, Optional[str]]) -> Optional[Tuple[Dict[str, Any], int, str]]:
+    with _overview_cache_lock:
+        cached = _overview_cache.get(key)
+        if cached and (time.time() - cached[0]) < _OVERVIEW_CACHE_TTL_SECONDS:
+            return cached[1]
+    return None
+
+
+def _store_cached_overview(key: Tuple[date, date, Optional[str]], value: Tuple[Dict[str, Any], int, str]) -> None:
+    with _overview_cache_lock:
+        _overview_cache.pop(key, None)
+        while len(_overview_cache) >= _OVERVIEW_CACHE_MAX_ENTRIES:
+            _overview_cache.pop(next(iter(_overview_cache)))
+        _overview_cache[key] = (time.time(), value)
+
+
+def _payload_digest(payload: Dict[str, Any]) -> str:
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 
 def _today_melb() -> date:
@@ -30,71 +90,196 @@ def _parse_date_param(value: Optional[str]) -> Optional[date]:
     return date.fromisoformat(value)
 
 
+# Status by finishing position; index 0 (no position) is PENDING and
+# anything past the end of the table is LOSE.
+_POS_TO_STATUS = ("PENDING", "WIN", "PLACE", "PLACE")
+
+
 def _classify_outcome_from_pos(pos_fin: Optional[int]) -> str:
     """
     Map finishing position from RA results to a TipOutcome-style status.
     """
     if pos_fin is None or pos_fin <= 0:
         return "PENDING"
-    if pos_fin == 1:
-        return "WIN"
-    if pos_fin in (2, 3):
-        return "PLACE"
+    if pos_fin < len(_POS_TO_STATUS):
+        return _POS_TO_STATUS[pos_fin]
     return "LOSE"
 
 
+@lru_cache(maxsize=64)
+def _is_ai_best(tip_type: Optional[str]) -> bool:
+    """Whether a tip_type counts as "AI Best". Only a handful of values exist."""
+    return isinstance(tip_type, str) and tip_type.strip().lower() in AI_BEST_LABELS
+
+
+# Per-day RA indexes, keyed by meeting day. An entry is reused only while
+# fetch_results_for_date_cached still hands back the same rows list, so it
+# expires together with the results cache. Bounded; oldest day goes first.
+_RA_DAY_INDEX_MAX_ENTRIES = 64
+
+_ra_day_index_cache: Dict[date, Tuple[List[Any], _RunnerIndex, Dict[Tuple[date, str, int], Dict[str, Optional[int]]]]] = {}
+_ra_day_index_lock = threading.Lock()
+
+
+def _index_ra_day(
+    rows: List[Any],
+) -> Tuple[_RunnerIndex, Dict[Tuple[date, str, int], Dict[str, Optional[int]]]]:
+    """Runner + race-winner indexes for one day's RA rows."""
+    runner_index = _RunnerIndex()
+    race_index: Dict[Tuple[date, str, int], Dict[str, Optional[int]]] = {}
+    for r in rows:
+        # RAResultsClient already strips, upper-cases and interns state.
+        state = r.state
+        k_runner = (r.meeting_date, state, r.race_no, r.tab_number)
+        runner_index.add(k_runner, r)
+
+        k_race = (r.meeting_date, state, r.race_no)
+        winners = race_index.setdefault(k_race, {})
+        track = r.track or ""
+        # Winner is finishing_pos == 1 and not scratched; first one wins.
+        if winners.get(track) is None:
+            winners[track] = (
+                int(r.tab_number)
+                if r.finishing_pos == 1 and not r.is_scratched
+                else None
+            )
+    return runner_index, race_index
+
+
+def _get_ra_day_index(
+    day: date, rows: List[Any],
+) -> Tuple[_RunnerIndex, Dict[Tuple[date, str, int], Dict[str, Optional[int]]]]:
+    with _ra_day_index_lock:
+        cached = _ra_day_index_cache.get(day)
+    if cached is not None and cached[0] is rows:
+        return cached[1], cached[2]
+
+    runner_sub, race_sub = _index_ra_day(rows)
+    with _ra_day_index_lock:
+        _ra_day_index_cache.pop(day, None)
+        while len(_ra_day_index_cache) >= _RA_DAY_INDEX_MAX_ENTRIES:
+            _ra_day_index_cache.pop(next(iter(_ra_day_index_cache)))
+        _ra_day_index_cache[day] = (rows, runner_sub, race_sub)
+    return runner_sub, race_sub
+
+
 def _build_ra_results_indexes(
-    d_from: date,
-    d_to: date,
+    days: List[date],
 ) -> Tuple[
-    Dict[Tuple[date, str, int, int], List[Any]],
-    Dict[Tuple[date, str, int], List[Any]],
+    _RunnerIndex,
+    Dict[Tuple[date, str, int], Dict[str, Optional[int]]],
 ]:
     """
-    Build indexes over RA Crawler results for the date window [d_from, d_to].
+    Build indexes over RA Crawler results for the given meeting days.
+
+    runner_index key: (meeting_date, STATE, race_no, tab_number) -> RAResultRow
+    race_index key:   (meeting_date, STATE, race_no)            -> {RA track: winner TAB or None}
+
+    Runner lookups go through _RunnerIndex.lookup(), which only runs track
+    resolution for the rare keys shared by more than one meeting.
+    Race winners are resolved here, in the same pass, so the Quaddie
+    check doesn't rescan every runner of a race.
 
-    runner_index key: (meeting_date, STATE, race_no, tab_number) -> list[RAResultRow]
-    race_index key:   (meeting_date, STATE, race_no)            -> list[RAResultRow]
+    Each day is indexed once and cached (see _get_ra_day_index); every key
+    starts with the meeting date, so days merge with plain dict updates.
+    The per-day dicts are shared between requests and must not be mutated.
     """
-    runner_index: Dict[Tuple[date, str, int, int], List[Any]] = {}
-    race_index: Dict[Tuple[date, str, int], List[Any]] = {}
+    runner_index = _RunnerIndex()
+    race_index: Dict[Tuple[date, str, int], Dict[str, Optional[int]]] = {}
 
-    client = RAResultsClient()
-    try:
-        day = d_from
-        while day <= d_to:
-            try:
-                rows = client.fetch_results_for_date(day)
-                print(f"[OVR] RA rows for {day}: {len(rows)}")
-            except Exception as e:
-                print(f"[OVR] error fetching RA rows for {day}: {e}")
-                rows = []
-
-            for r in rows:
-                k_runner = (
-                    r.meeting_date,
-                    (r.state or "").upper(),
-                    r.race_no,
-                    r.tab_number,
-                )
-                runner_index.setdefault(k_runner, []).append(r)
+    def _fetch_day(day: date) -> List[Any]:
+        try:
+            # Cached per day: past days are final, today expires quickly.
+            rows = fetch_results_for_date_cached(day)
+            log.debug("[OVR] RA rows for %s: %d", day, len(rows))
+            return rows
+        except Exception as e:
+            log.warning("[OVR] error fetching RA rows for %s: %s", day, e)
+            return []
+
+    # Days are independent, so fetch them concurrently; merge in day order.
+    if not days:
+        return runner_index, race_index
+    with ThreadPoolExecutor(max_workers=min(RA_FETCH_PARALLEL, len(days))) as executor:
+        day_rows = list(executor.map(_fetch_day, days))
+
+    for day, rows in zip(days, day_rows):
+        if not rows:
+            continue
+        runner_sub, race_sub = _get_ra_day_index(day, rows)
+        runner_index.single.update(runner_sub.single)
+        runner_index.multi.update(runner_sub.multi)
+        race_index.update(race_sub)
+
+    if log.isEnabledFor(logging.INFO):
+        total_runner = len(runner_index)
+        log.info(
+            "[OVR] RA indexes for %d days: %d runner rows, %d races",
+            len(days), total_runner, len(race_index),
+        )
+    return runner_index, race_index
 
-                k_race = (
-                    r.meeting_date,
-                    (r.state or "").upper(),
-                    r.race_no,
-                )
-                race_index.setdefault(k_race, []).append(r)
 
-            day += timedelta(days=1)
-    finally:
-        client.close()
+@lru_cache(maxsize=2048)
+def _norm_track(name: str) -> str:
+    """Canonical track key: lowercase alphanumerics only."""
+    return "".join(c for c in name.lower() if c.isalnum())
 
-    total_runner = sum(len(v) for v in runner_index.values())
-    total_race = sum(len(v) for v in race_index.values())
-    print(f"[OVR] RA runner_index total rows = {total_runner}")
-    print(f"[OVR] RA race_index total rows = {total_race}")
-    return runner_index, race_index
+
+@lru_cache(maxsize=4096)
+def _match_ra_track(meeting_track: str, ra_tracks: Tuple[str, ...]) -> str:
+    """
+    RA track name for the meeting's track: an exact canonical match first,
+    then the first fuzzy match, else the first name. Cached because every
+    tip in a race asks the same question.
+    """
+    mt_norm = _norm_track(meeting_track)
+    for name in ra_tracks:
+        if _norm_track(name) == mt_norm:
+            return name
+    for name in ra_tracks:
+        if _tracks_match(meeting_track, name):
+            return name
+    return ra_tracks[0]
+
+
+@dataclass(slots=True)
+class _RunnerIndex:
+    """
+    RA runner rows keyed by (meeting_date, STATE, race_no, tab_number).
+
+    Almost every key belongs to a single meeting and lives in `single`.
+    A key moves to `multi` ({RA track: row}) only when a second track
+    turns up for it. The first row per track wins.
+    """
+    single: Dict[Tuple[date, str, int, int], Any] = field(default_factory=dict)
+    multi: Dict[Tuple[date, str, int, int], Dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, key: Tuple[date, str, int, int], row: Any) -> None:
+        track = row.track or ""
+        tracks = self.multi.get(key)
+        if tracks is not None:
+            tracks.setdefault(track, row)
+            return
+        first = self.single.get(key)
+        if first is None:
+            self.single[key] = row
+        elif (first.track or "") != track:
+            del self.single[key]
+            self.multi[key] = {first.track or "": first, track: row}
+
+    def lookup(self, key: Tuple[date, str, int, int], meeting_track: str) -> Optional[Any]:
+        """Resolve a key to one RA row for this meeting."""
+        row = self.single.get(key)
+        if row is not None:
+            return row
+        tracks = self.multi.get(key)
+        if not tracks:
+            return None
+        return tracks[_match_ra_track(meeting_track or "", tuple(tracks))]
+
+    def __len__(self) -> int:
+        return len(self.single) + sum(len(v) for v in self.multi.values())
 
 
 def _winner_tab_for_race(
@@ -102,61 +287,53 @@ def _winner_tab_for_race(
     state: str,
     track_name: str,
     race_no: int,
-    ra_race_index: Dict[Tuple[date, str, int], List[Any]],
+    ra_race_index: Dict[Tuple[date, str, int], Dict[str, Optional[int]]],
 ) -> Optional[int]:
     """
     Find the winner TAB number for a race using RA rows.
-    We use fuzzy track matching to disambiguate when the same (date,state,race_no)
+    We use track matching to disambiguate when the same (date,state,race_no)
     appears across multiple meetings.
     """
     key = (meeting_date, (state or "").upper(), int(race_no))
-    rows = ra_race_index.get(key) or []
-    if not rows:
+    winners = ra_race_index.get(key)
+    if not winners:
         return None
+    if len(winners) == 1:
+        # Only one meeting ran this race number: no track to resolve.
+        for tab in winners.values():
+            return tab
 
-    # Prefer rows that match this track
-    matched: List[Any] = []
+    # Prefer tracks that match this one: exact canonical name first, then
+    # the fuzzy matcher; otherwise consider every track.
     mt = track_name or ""
-    for r in rows:
-        try:
-            if _tracks_match(mt, getattr(r, "track", "") or ""):
-                matched.append(r)
-        except Exception:
-            pass
-
-    candidates = matched if matched else rows
-
-    # Winner is finishing_pos == 1 and not scratched
-    for r in candidates:
-        try:
-            if getattr(r, "is_scratched", False):
-                continue
-            if getattr(r, "finishing_pos", None) == 1:
-                return int(getattr(r, "tab_number", None))
-        except Exception:
-            continue
-
+    mt_norm = _norm_track(mt)
+    matched = [t for t in winners if _norm_track(t) == mt_norm]
+    if not matched:
+        matched = [t for t in winners if _tracks_match(mt, t)]
+
+    for t in matched or winners:
+        tab = winners[t]
+        if tab is not None:
+            return tab
     return None
 
 
 def _compute_quaddie_for_bucket(
-    bucket: Dict[str, Any],
-    ra_race_index: Dict[Tuple[date, str, int], List[Any]],
+    bucket: _MeetingBucket,
+    ra_race_index: Dict[Tuple[date, str, int], Dict[str, Optional[int]]],
 ) -> Dict[str, Any]:
     """
     Quaddie = last 4 races of the meeting/day.
     Hit a leg if the winner TAB is inside the 3 tips for that race.
     """
-    meeting_date: date = bucket["date"]
-    track_name: str = bucket["track"]
-    state: str = bucket["state"]
+    meeting_date = bucket.date
+    track_name = bucket.track
+    state = bucket.state
 
-    race_numbers: Dict[int, int] = bucket.get("race_numbers", {})  # race.id -> race_no
-    race_tips: Dict[int, Set[int]] = bucket.get("race_tips", {})   # race.id -> set(tab)
+    race_tips = bucket.race_tips        # race.id -> set(tab)
 
-    # Sort races by race number and take the last 4
-    races_sorted = sorted(race_numbers.items(), key=lambda kv: kv[1])  # (race_id, race_no)
-    last4 = races_sorted[-4:] if len(races_sorted) >= 4 else races_sorted
+    # Last 4 races by race number, kept up to date while aggregating
+    last4 = [(race_id, race_no) for race_no, race_id in sorted(bucket.last4)]
 
     if len(last4) != 4:
         return {"eligible": False, "hits": 0, "hit": False, "race_nos": [rn for _, rn in last4]}
@@ -180,239 +357,329 @@ def _compute_quaddie_for_bucket(
     return {"eligible": eligible, "hits": hits, "hit": (eligible and hits == 4), "race_nos": race_nos}
 
 
-@router.get("/ui/overview", response_class=HTMLResponse)
-def ui_overview(
-    request: Request,
-    date_from: Optional[str] = Query(
-        None,
-        description="Start date (YYYY-MM-DD). Default: 7 days ago (incl. today).",
-    ),
-    date_to: Optional[str] = Query(
-        None,
-        description="End date (YYYY-MM-DD). Default: today (Melbourne).",
-    ),
-    json: bool = Query(
-        False,
-        description="If true, return raw JSON instead of HTML.",
-    ),
-    source: Optional[str] = Query(
-        "Gemini",
-        description=(
-            "Filter tips by source: 'Gemini' (default), 'iReel', or 'all'. "
-            "Aggregation excludes other providers so wins/strike-rate/ROI "
-            "reflect a single tip provider."
-        ),
-    ),
-    db: Session = Depends(get_db),
-):
-    """
-    Overview of tips & results across tracks for a date window.
+@dataclass(slots=True)
+class _MeetingBucket:
+    """Running totals for one (meeting date, track, state) overview row."""
+    date: date
+    track: str
+    state: str
+    tips: int = 0
+    wins: int = 0
+    places: int = 0
+    stakes: float = 0.0
+    ret: float = 0.0
+    # AI-best and per-race positions
+    ai_best_wins: int = 0
+    race_podium: Dict[str, int] = field(default_factory=lambda: defaultdict(int))       # race.id -> bit n set <=> a tip ran n-th
+    # Per-race tips + race numbers for Quaddie calc
+    race_tips: Dict[str, Set[int]] = field(default_factory=lambda: defaultdict(set))  # race.id -> set(tab_number)
+    race_numbers: Dict[str, int] = field(default_factory=dict)         # race.id -> race.race_number
+    last4: List[Tuple[int, str]] = field(default_factory=list)         # min-heap of (race_no, race.id)
+    ra_state: str = ""                                                 # upper-cased state for RA keys
+
+    def add_race(self, race_id: str, race_no: int) -> None:
+        """Record a race seen for the first time; keeps the last-4 heap current."""
+        self.race_numbers[race_id] = race_no
+        if len(self.last4) < 4:
+            heappush(self.last4, (race_no, race_id))
+        elif race_no > self.last4[0][0]:
+            heapreplace(self.last4, (race_no, race_id))
+
+
+def _add_result(
+    bucket: _MeetingBucket,
+    status: Optional[str],
+    sp_src: Any,
+    stake_units: float,
+    ai_is_best: bool,
+) -> None:
+    """Status → wins / places / AI-best wins / return for one tip."""
+    d_win, d_place = _STATUS_DELTAS.get(status, _NO_DELTA)
+    bucket.wins += d_win
+    bucket.places += d_place
+    if d_win:
+        if ai_is_best:
+            bucket.ai_best_wins += 1
+        # Simple return calc: for winners, SP * stake; others 0
+        if isinstance(sp_src, (Decimal, float, int)):
+            bucket.ret += stake_units * float(sp_src)
 
-    Source-of-truth for results:
-      • FIRST: RA Crawler results (via RAResultsClient)
-      • FALLBACK: TipOutcome rows (legacy PF import)
 
-    Aggregation is per (meeting date, track, state) so each line
-    is a single meeting/day, not merged across the window.
+def _aggregate_days_without_ra(
+    db: Session,
+    days: List[date],
+    source: Optional[str],
+    agg: Dict[Tuple[date, str, str], _MeetingBucket],
+) -> None:
     """
-    today = _today_melb()
+    Aggregate days that have no RA results in SQL.
 
-    d_to = _parse_date_param(date_to) or today
-    d_from = _parse_date_param(date_from) or (d_to - timedelta(days=6))
+    With nothing to override, every tip on these days falls back to its
+    TipOutcome row, so tips / wins / places / stakes / return can be summed
+    with a GROUP BY instead of walking each tip in Python. Race numbers are
+    fetched separately for the Quaddie column (no RA winners means no hits).
+    """
+    stake = func.coalesce(func.nullif(Tip.stake_units, 0), 1)
+    status = func.coalesce(TipOutcome.outcome_status, "PENDING")
+    is_win = status == "WIN"
+
+    def _scoped(q):
+        # Both queries select Meeting columns first; anchor FROM on tips.
+        q = (
+            q.select_from(Tip)
+            .join(Race, Tip.race_id == Race.id)
+            .join(Meeting, Race.meeting_id == Meeting.id)
+            .join(TipRun, Tip.tip_run_id == TipRun.id)
+            .filter(Meeting.date.in_(days))
+        )
+        if source and source.lower() != "all":
+            q = q.filter(TipRun.source == source)
+        return q
+
+    totals = _scoped(
+        db.query(
+            Meeting.date,
+            Meeting.track_name,
+            Meeting.state,
+            func.count(Tip.id),
+            func.sum(case((is_win, 1), else_=0)),
+            func.sum(case((status.in_(("WIN", "PLACE")), 1), else_=0)),
+            func.sum(stake),
+            func.sum(
+                case(
+                    (
+                        and_(is_win, TipOutcome.starting_price.isnot(None)),
+                        stake * TipOutcome.starting_price,
+                    ),
+                    else_=0,
+                )
+            ),
+            func.sum(
+                case(
+                    (
+                        and_(is_win, func.lower(func.trim(Tip.tip_type)).in_(sorted(AI_BEST_LABELS))),
+                        1,
+                    ),
+                    else_=0,
+                )
+            ),
+        )
+    ).outerjoin(TipOutcome, TipOutcome.tip_id == Tip.id).group_by(
+        Meeting.date, Meeting.track_name, Meeting.state
+    )
 
-    # 1) Build RA results indexes for the window
-    ra_index, ra_race_index = _build_ra_results_indexes(d_from, d_to)
+    for m_date, track_name, state, tips, wins, places, stakes, ret, ai_best in totals:
+        # Each (date, track, state) appears once in the GROUP BY output.
+        bucket = agg[(m_date, track_name, state)] = _MeetingBucket(m_date, track_name, state)
+        bucket.tips += int(tips or 0)
+        bucket.wins += int(wins or 0)
+        bucket.places += int(places or 0)
+        bucket.stakes += float(stakes or 0)
+        bucket.ret += float(ret or 0)
+        bucket.ai_best_wins += int(ai_best or 0)
+
+    races = _scoped(
+        db.query(Meeting.date, Meeting.track_name, Meeting.state, Race.id, Race.race_number)
+    ).distinct()
+    for m_date, track_name, state, race_id, race_number in races:
+        bucket = agg.get((m_date, track_name, state))
+        if bucket is not None and race_id not in bucket.race_numbers:
+            bucket.add_race(race_id, int(race_number or 0))
+
+
+def _compute_overview(
+    db: Session,
+    d_from: date,
+    d_to: date,
+    source: Optional[str],
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Build the overview payload for [d_from, d_to] and the total tip count.
 
-    # 2) Fetch all tips + (optional) outcomes in that window
-    q = (
-        db.query(Tip, TipOutcome, Race, Meeting)
+    Source-of-truth for results:
+      • FIRST: RA Crawler results (via fetch_results_for_date_cached)
+      • FALLBACK: TipOutcome rows (legacy PF import)
+    """
+    empty_payload = {
+        "dateFrom": d_from.isoformat(),
+        "dateTo": d_to.isoformat(),
+        "tracks": [],
+        "quaddieHits": 0,
+    }
+
+    # 0) Only days that actually have tips need RA results; empty windows
+    #    skip the RA fetch and aggregation altogether.
+    tip_days_q = (
+        db.query(Meeting.date)
+        .select_from(Tip)
         .join(Race, Tip.race_id == Race.id)
         .join(Meeting, Race.meeting_id == Meeting.id)
         .join(TipRun, Tip.tip_run_id == TipRun.id)
-        .outerjoin(TipOutcome, TipOutcome.tip_id == Tip.id)
         .filter(Meeting.date >= d_from, Meeting.date <= d_to)
     )
     if source and source.lower() != "all":
-        q = q.filter(TipRun.source == source)
-    rows = q.all()
-    print(
-        f"[OVR] raw rows (Tip+Outcome+Race+Meeting) in window "
-        f"{d_from} → {d_to}: {len(rows)}"
+        tip_days_q = tip_days_q.filter(TipRun.source == source)
+    tip_days = sorted(d for (d,) in tip_days_q.distinct())
+    if not tip_days:
+        return empty_payload, 0
+
+    # 1) Build RA results indexes for those days
+    ra_index, ra_race_index = _build_ra_results_indexes(tip_days)
+
+    # 2) Days with no RA results only ever use TipOutcome, so aggregate them
+    #    in SQL; the per-tip loop below is kept for RA-first overrides.
+    agg: Dict[Tuple[date, str, str], _MeetingBucket] = {}
+    ra_days = {k[0] for k in ra_race_index}
+    sql_days = [d for d in tip_days if d not in ra_days]
+    loop_days = [d for d in tip_days if d in ra_days]
+    if sql_days:
+        _aggregate_days_without_ra(db, sql_days, source, agg)
+
+    # 3) Fetch tips on RA-covered days. TipOutcome is only needed for tips
+    #    RA has no row for, so it's looked up afterwards for just those.
+    q = (
+        # Plain columns rather than ORM entities: only these fields are read,
+        # so skip identity-map hydration for every row.
+        db.query(
+            Meeting.date,
+            Meeting.track_name,
+            Meeting.state,
+            Race.id,
+            Race.race_number,
+            Tip.tab_number,
+            Tip.stake_units,
+            Tip.tip_type,
+            Tip.id,
+        )
+        .select_from(Tip)
+        .join(Race, Tip.race_id == Race.id)
+        .join(Meeting, Race.meeting_id == Meeting.id)
+        .join(TipRun, Tip.tip_run_id == TipRun.id)
+        .filter(Meeting.date.in_(loop_days))
     )
-
-    # 3) Aggregate per (date, track, state)
-    agg: Dict[tuple[date, str, str], Dict[str, Any]] = {}
-
-    for tip, outcome, race, meeting in rows:
-        key_date = meeting.date
-        key_track = meeting.track_name
-        key_state = meeting.state
+    if source and source.lower() != "all":
+        q = q.filter(TipRun.source == source)
+    # Stream the window in batches instead of materialising every row; only
+    # the per-meeting aggregates below are kept.
+    rows = q.yield_per(OVERVIEW_YIELD_PER) if loop_days else []
+
+    # 4) Aggregate per (date, track, state)
+    n_rows = 0
+    debug = log.isEnabledFor(logging.DEBUG)
+    # tip_id -> (bucket, stake_units, ai_is_best) for tips with no RA row
+    fallback: Dict[str, Tuple[_MeetingBucket, float, bool]] = {}
+
+    for (
+        key_date,
+        key_track,
+        key_state,
+        race_id,
+        race_number,
+        tab_number,
+        tip_stake,
+        tip_type,
+        tip_id,
+    ) in rows:
+        n_rows += 1
 
         key = (key_date, key_track, key_state)
-        if key not in agg:
-            agg[key] = {
-                "date": key_date,
-                "track": key_track,
-                "state": key_state,
-                "tips": 0,
-                "wins": 0,
-                "places": 0,
-                "stakes": Decimal("0.0"),
-                "return": Decimal("0.0"),
-                # AI-best and per-race positions
-                "ai_best_wins": 0,
-                "race_positions": {},  # race.id -> set of finishing positions
-                # NEW: per-race tips + race numbers for Quaddie calc
-                "race_tips": {},        # race.id -> set(tab_number)
-                "race_numbers": {},     # race.id -> race.race_number
-            }
-
-        bucket = agg[key]
-        bucket["tips"] += 1
+        bucket = agg.get(key)
+        if bucket is None:
+            bucket = agg[key] = _MeetingBucket(
+                key_date, key_track, key_state, ra_state=(key_state or "").upper()
+            )
+        bucket.tips += 1
 
-        # Stake units (Numeric in DB) → Decimal
-        stake_units = Decimal(str(tip.stake_units or 1))
-        bucket["stakes"] += stake_units
+        # Stake units (Numeric in DB) → float; the payload is float anyway
+        stake_units = float(tip_stake or 1)
+        bucket.stakes += stake_units
 
-        # Track per-race tips (for Quaddies)
-        try:
-            rt = bucket["race_tips"].setdefault(race.id, set())
-            rt.add(int(tip.tab_number))
-        except Exception:
-            pass
+        # Track per-race tips (for Quaddies); tab_number is NOT NULL
+        bucket.race_tips[race_id].add(tab_number)
 
-        try:
-            bucket["race_numbers"][race.id] = int(race.race_number)
-        except Exception:
-            bucket["race_numbers"][race.id] = 0
+        if race_id not in bucket.race_numbers:
+            try:
+                race_no = int(race_number)
+            except Exception:
+                race_no = 0
+            bucket.add_race(race_id, race_no)
 
-        # -----------------------------
         # Detect whether this Tip is "AI Best"
-        # -----------------------------
-        ai_is_best = False
-
-        slot = getattr(tip, "slot", None)
-        if isinstance(slot, int) and slot == 1:
-            ai_is_best = True
-        elif isinstance(slot, str) and slot.strip().lower() in {"best", "ai_best", "ai best", "ai-best"}:
-            ai_is_best = True
-
-        label = (
-            getattr(tip, "tip_type", None)
-            or getattr(tip, "kind", None)
-            or getattr(tip, "role", None)
-            or getattr(tip, "tip_label", None)
-        )
-        if isinstance(label, str) and label.strip().lower() in {"best", "ai_best", "ai best", "ai-best"}:
-            ai_is_best = True
+        ai_is_best = _is_ai_best(tip_type)
 
         # -----------------------------
         # RA-FIRST status + SP + finishing pos
         # -----------------------------
-        status: Optional[str] = None
-        sp_src: Any = None
-        pos: Optional[int] = None  # finishing position if known
-
-        ra_key = (
-            meeting.date,
-            (meeting.state or "").upper(),
-            race.race_number,
-            tip.tab_number,
-        )
-        candidates = ra_index.get(ra_key) or []
-        ra_row = None
-
-        if candidates:
-            mt_track = meeting.track_name or ""
-            if len(candidates) == 1:
-                ra_row = candidates[0]
-            else:
-                for cand in candidates:
-                    if _tracks_match(mt_track, cand.track):
-                        ra_row = cand
-                        break
-                if ra_row is None:
-                    ra_row = candidates[0]
+        ra_key = (key_date, bucket.ra_state, race_number, tab_number)
+        ra_row = ra_index.lookup(ra_key, key_track)
 
-        if ra_row is not None:
-            pos = getattr(ra_row, "finishing_pos", None)
-            if getattr(ra_row, "is_scratched", False):
-                status = "SCRATCHED"
-            else:
-                status = _classify_outcome_from_pos(pos)
-            sp_src = ra_row.starting_price
-
-            print(
-                f"[OVR] RA primary {meeting.track_name} {meeting.state} "
-                f"{meeting.date} R{race.race_number} #{tip.tab_number}: "
-                f"pos={pos}, sp={ra_row.starting_price}, status={status}"
-            )
+        if ra_row is None:
+            fallback[tip_id] = (bucket, stake_units, ai_is_best)
+            continue
+
+        # RAResultRow is a dataclass: plain attribute reads, no getattr().
+        pos: Optional[int] = ra_row.finishing_pos
+        if ra_row.is_scratched:
+            status = "SCRATCHED"
         else:
-            if outcome is not None:
-                status = outcome.outcome_status or "PENDING"
-                pos = (
-                    getattr(outcome, "finishing_pos", None)
-                    or getattr(outcome, "position", None)
-                    or getattr(outcome, "outcome_position", None)
-                )
-                sp_src = outcome.starting_price
-            else:
-                status = "PENDING"
-                sp_src = None
-                pos = None
+            status = _classify_outcome_from_pos(pos)
 
-        # -----------------------------
-        # Status → wins / places / return
-        # -----------------------------
-        if status == "WIN":
-            bucket["wins"] += 1
-            bucket["places"] += 1
-        elif status == "PLACE":
-            bucket["places"] += 1
+        if debug:
+            log.debug(
+                "[OVR] RA primary %s %s %s R%s #%s: pos=%s, sp=%s, status=%s",
+                key_track, key_state, key_date, race_number, tab_number,
+                pos, ra_row.starting_price, status,
+            )
 
-        if status == "WIN" and ai_is_best:
-            bucket["ai_best_wins"] += 1
+        _add_result(bucket, status, ra_row.starting_price, stake_units, ai_is_best)
 
         # Track race-wise finishing positions (for Quinella / Trifecta)
         if isinstance(pos, int) and pos in (1, 2, 3):
-            race_pos_map = bucket["race_positions"]
-            race_set = race_pos_map.setdefault(race.id, set())
-            race_set.add(int(pos))
-
-        # Simple return calc: for winners, SP * stake; others 0
-        if isinstance(sp_src, (Decimal, float, int)):
-            sp_dec = Decimal(str(sp_src))
-        else:
-            sp_dec = None
-
-        if status == "WIN" and sp_dec is not None:
-            bucket["return"] += stake_units * sp_dec
+            bucket.race_podium[race_id] |= 1 << pos
+
+    # FALLBACK: legacy TipOutcome rows for tips RA didn't cover. They only
+    # contribute status + SP; tips without one stay PENDING (no deltas).
+    fallback_ids = list(fallback)
+    for i in range(0, len(fallback_ids), OUTCOME_IN_BATCH):
+        outcomes = db.query(
+            TipOutcome.tip_id, TipOutcome.outcome_status, TipOutcome.starting_price
+        ).filter(TipOutcome.tip_id.in_(fallback_ids[i:i + OUTCOME_IN_BATCH]))
+        for tip_id, outcome_status, outcome_sp in outcomes:
+            bucket, stake_units, ai_is_best = fallback[tip_id]
+            _add_result(bucket, outcome_status or "PENDING", outcome_sp, stake_units, ai_is_best)
+
+    log.info(
+        "[OVR] raw rows (tip columns) on %d RA days in window %s → %s: %d "
+        "(%d days aggregated in SQL)",
+        len(loop_days), d_from, d_to, n_rows, len(sql_days),
+    )
 
-    # 4) Convert aggregates to list + compute strike rates, ROI, Quin, Tri, Quaddie
+    # 5) Convert aggregates to list + compute strike rates, ROI, Quin, Tri, Quaddie
     tracks: list[Dict[str, Any]] = []
     quaddie_hits_total = 0
+    total_tips = 0
 
     for (row_date, track_name, state), b in agg.items():
-        tips = b["tips"]
-        wins = b["wins"]
-        places = b["places"]
-        stakes = b["stakes"]
-        ret = b["return"]
-        ai_best_wins = b.get("ai_best_wins", 0)
+        tips = b.tips
+        wins = b.wins
+        places = b.places
+        stakes = b.stakes
+        ret = b.ret
+        ai_best_wins = b.ai_best_wins
+        total_tips += tips
 
         win_sr = float(wins) / tips if tips else 0.0
         place_sr = float(places) / tips if tips else 0.0
-        roi = float(ret / stakes) - 1.0 if stakes > 0 else 0.0
+        roi = ret / stakes - 1.0 if stakes > 0 else 0.0
 
-        # Compute Quinella / Trifecta counts from race_positions
-        race_positions = b.get("race_positions", {})
+        # Compute Quinella / Trifecta counts from the per-race podium masks
         quin = 0
         tri = 0
-        for positions in race_positions.values():
-            if 1 in positions and 2 in positions:
+        for mask in b.race_podium.values():
+            if mask & 0b0110 == 0b0110:
                 quin += 1
-            if 1 in positions and 2 in positions and 3 in positions:
-                tri += 1
+                if mask == 0b1110:
+                    tri += 1
 
         # Compute Quaddie (RA winners)
         q = _compute_quaddie_for_bucket(b, ra_race_index)
@@ -429,8 +696,8 @@ def ui_overview(
                 "places": places,
                 "winStrikeRate": win_sr,
                 "placeStrikeRate": place_sr,
-                "stakes": float(stakes),
-                "return": float(ret),
+                "stakes": stakes,
+                "return": ret,
                 "roi": roi,
                 "aiBestWins": ai_best_wins,
                 "quinellas": quin,
@@ -444,33 +711,90 @@ def ui_overview(
         )
 
     # Sort: latest date first, then best ROI, then tips desc
-    tracks.sort(key=lambda t: (t["date"], t["roi"], t["tips"]), reverse=True)
+    tracks.sort(key=itemgetter("date", "roi", "tips"), reverse=True)
 
-    payload = {
-        "dateFrom": d_from.isoformat(),
-        "dateTo": d_to.isoformat(),
-        "tracks": tracks,
-        "quaddieHits": quaddie_hits_total,
-    }
+    payload = dict(empty_payload, tracks=tracks, quaddieHits=quaddie_hits_total)
+    return payload, total_tips
+
+
+@router.get("/ui/overview", response_class=HTMLResponse)
+def ui_overview(
+    request: Request,
+    date_from: Optional[str] = Query(
+        None,
+        description="Start date (YYYY-MM-DD). Default: 7 days ago (incl. today).",
+    ),
+    date_to: Optional[str] = Query(
+        None,
+        description="End date (YYYY-MM-DD). Default: today (Melbourne).",
+    ),
+    as_json: bool = Query(
+        False,
+        alias="json",
+        description="If true, return raw JSON instead of HTML.",
+    ),
+    source: Optional[str] = Query(
+        "Gemini",
+        description=(
+            "Filter tips by source: 'Gemini' (default), 'iReel', or 'all'. "
+            "Aggregation excludes other providers so wins/strike-rate/ROI "
+            "reflect a single tip provider."
+        ),
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Overview of tips & results across tracks for a date window.
+
+    Source-of-truth for results:
+      • FIRST: RA Crawler results (via RAResultsClient)
+      • FALLBACK: TipOutcome rows (legacy PF import)
+
+    Aggregation is per (meeting date, track, state) so each line
+    is a single meeting/day, not merged across the window.
+    """
+    today = _today_melb()
+
+    d_to = _parse_date_param(date_to) or today
+    d_from = _parse_date_param(date_from) or (d_to - timedelta(days=6))
+
+    # Past windows can't change any more (bar late result corrections), so
+    # they are served from an in-process cache and marked cacheable.
+    is_past = d_to < today
+    cache_key = (d_from, d_to, source)
+    cached = _get_cached_overview(cache_key) if is_past else None
+    if cached is not None:
+        payload, total_tips, digest = cached
+    else:
+        payload, total_tips = _compute_overview(db, d_from, d_to, source)
+        digest = _payload_digest(payload)
+        if is_past:
+            _store_cached_overview(cache_key, (payload, total_tips, digest))
+
+    etag = f'"{digest}-{"json" if as_json else "html"}"'
+    max_age = PAST_WINDOW_MAX_AGE if is_past else CURRENT_WINDOW_MAX_AGE
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
 
     # If caller wants JSON, short-circuit here
-    if json:
-        return JSONResponse(payload)
+    if as_json:
+        return JSONResponse(payload, headers=headers)
 
-    # 5) Render HTML via Jinja2 template
+    # Render HTML via Jinja2 template
     return templates.TemplateResponse(
         "overview_table.html",
         {
             "request": request,
             "date_from": d_from,
             "date_to": d_to,
-            "tracks": tracks,
-            "total_tips": sum(t["tips"] for t in tracks),
+            "tracks": payload["tracks"],
+            "total_tips": total_tips,
             "quaddie_hits": payload.get("quaddieHits", 0),
         },
+        headers=headers,
     )
 
-
 @router.get("/ui/meeting-social", response_class=HTMLResponse)
 def ui_meeting_social(
     request: Request,
@@ -487,15 +811,20 @@ def ui_meeting_social(
     if d is None:
         d = _today_melb()
 
-    # 1) Build RA results index for this single day
-    ra_index, _ = _build_ra_results_indexes(d, d)
-
-    # 2) Fetch tips for this specific meeting
+    # 1) Fetch tips for this specific meeting. Only these columns are read;
+    #    the meeting's date/track/state are the filter values themselves.
     rows = (
-        db.query(Tip, TipOutcome, Race, Meeting)
+        db.query(
+            Race.race_number,
+            Race.name,
+            Tip.tab_number,
+            Tip.horse_name,
+            Tip.tip_type,
+            Tip.reasoning,
+        )
+        .select_from(Tip)
         .join(Race, Tip.race_id == Race.id)
         .join(Meeting, Race.meeting_id == Meeting.id)
-        .outerjoin(TipOutcome, TipOutcome.tip_id == Tip.id)
         .filter(
             Meeting.date == d,
             Meeting.track_name == track,
@@ -517,15 +846,18 @@ def ui_meeting_social(
             },
         )
 
+    # 2) Build RA results index for this single day
+    ra_index, _ = _build_ra_results_indexes([d])
+    ra_state = (state or "").upper()
+
     # 3) Group tips by race and determine results
     race_data: Dict[int, Dict[str, Any]] = {}  # race_number -> race info
 
-    for tip, _outcome, race, meeting in rows:
-        race_no = race.race_number
+    for race_no, race_name, tab_number, horse_name, tip_type, reasoning in rows:
         if race_no not in race_data:
             race_data[race_no] = {
                 "race_number": race_no,
-                "race_name": race.name,
+                "race_name": race_name,
                 "tips": [],
                 "winner": None,
                 "danger": None,
@@ -533,43 +865,23 @@ def ui_meeting_social(
             }
 
         # Determine tip's finishing position from RA results
-        ra_key = (
-            meeting.date,
-            (meeting.state or "").upper(),
-            race.race_number,
-            tip.tab_number,
-        )
-        candidates = ra_index.get(ra_key) or []
-        ra_row = None
-
-        if candidates:
-            mt_track = meeting.track_name or ""
-            if len(candidates) == 1:
-                ra_row = candidates[0]
-            else:
-                for cand in candidates:
-                    if _tracks_match(mt_track, cand.track):
-                        ra_row = cand
-                        break
-                if ra_row is None:
-                    ra_row = candidates[0]
+        ra_key = (d, ra_state, race_no, tab_number)
+        ra_row = ra_index.lookup(ra_key, track)
 
         finish_pos = None
         if ra_row is not None:
-            if not getattr(ra_row, "is_scratched", False):
-                finish_pos = getattr(ra_row, "finishing_pos", None)
+            if not ra_row.is_scratched:
+                finish_pos = ra_row.finishing_pos
 
-        # Check if AI_BEST
-        is_ai_best = False
-        tip_type = tip.tip_type or ""
-        if tip_type.upper() in {"AI_BEST", "AI BEST", "BEST"}:
-            is_ai_best = True
+        # Same "AI Best" test as the overview table
+        tip_type = tip_type or ""
+        is_ai_best = _is_ai_best(tip_type)
 
         tip_info = {
-            "tab_number": tip.tab_number,
-            "horse_name": tip.horse_name,
+            "tab_number": tab_number,
+            "horse_name": horse_name,
             "tip_type": tip_type,
-            "reasoning": tip.reasoning,
+            "reasoning": reasoning,
             "finish_pos": finish_pos,
             "is_ai_best": is_ai_best,
             "placed": finish_pos in (1, 2, 3) if finish_pos else False,
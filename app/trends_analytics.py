@@ -11,7 +11,9 @@ Results API calls are cached to reduce external requests.
 from __future__ import annotations
 
 import os
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 from decimal import Decimal
@@ -29,6 +31,9 @@ from . import models
 # ============================================================================
 _CACHE_TTL_SECONDS = 300  # 5 minutes
 
+# Max concurrent per-day Results API calls in compute_trends().
+RESULTS_FETCH_PARALLEL = 8
+
 _results_cache: Dict[date, Tuple[float, List["FlatResult"]]] = {}  # date -> (timestamp, results)
 
 
@@ -37,10 +42,26 @@ def _is_cache_valid(timestamp: float) -> bool:
     return (time.time() - timestamp) < _CACHE_TTL_SECONDS
 
 
+# Whole compute_trends() results, keyed by (date_from, date_to, source).
+# Short TTL: it only has to absorb dashboard refresh bursts.
+_TRENDS_CACHE_TTL_SECONDS = 60
+# Keys come straight from query params; bounded, expired windows go first,
+# then the oldest.
+_TRENDS_CACHE_MAX_ENTRIES = 128
+
+_trends_cache: Dict[Tuple[date, date, Optional[str]], Tuple[float, Dict[str, Any]]] = {}
+_trends_cache_lock = threading.Lock()
+# One lock per key so concurrent misses for the same window compute once.
+_trends_key_locks: Dict[Tuple[date, date, Optional[str]], threading.Lock] = {}
+
+
 def clear_trends_cache():
     """Clear results cache"""
     global _results_cache
     _results_cache.clear()
+    with _trends_cache_lock:
+        _trends_cache.clear()
+        _trends_key_locks.clear()
     print("[TRENDS] Cache cleared")
 
 
@@ -349,6 +370,58 @@ def compute_trends(
     date_from: Optional[date] = None,
     date_to: Optional[date] = None,
     source: Optional[str] = "Gemini",
+) -> Dict[str, Any]:
+    """
+    Cached front for _compute_trends(): identical (from, to, source) calls
+    within _TRENDS_CACHE_TTL_SECONDS share one computation.
+    """
+    if date_to is None:
+        date_to = date.today()
+    if date_from is None:
+        date_from = date_to - timedelta(days=60)
+
+    key = (date_from, date_to, source)
+
+    with _trends_cache_lock:
+        cached = _trends_cache.get(key)
+        if cached and (time.time() - cached[0]) < _TRENDS_CACHE_TTL_SECONDS:
+            return cached[1]
+        key_lock = _trends_key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another request may have filled it while we waited.
+        with _trends_cache_lock:
+            cached = _trends_cache.get(key)
+            if cached and (time.time() - cached[0]) < _TRENDS_CACHE_TTL_SECONDS:
+                return cached[1]
+
+        result = _compute_trends(db, date_from, date_to, source)
+        _store_trends(key, result)
+        return result
+
+
+def _store_trends(key: Tuple[date, date, Optional[str]], result: Dict[str, Any]) -> None:
+    now = time.time()
+    with _trends_cache_lock:
+        _trends_cache.pop(key, None)
+        if len(_trends_cache) >= _TRENDS_CACHE_MAX_ENTRIES:
+            for k in [k for k, (ts, _) in _trends_cache.items() if now - ts >= _TRENDS_CACHE_TTL_SECONDS]:
+                del _trends_cache[k]
+        while len(_trends_cache) >= _TRENDS_CACHE_MAX_ENTRIES:
+            _trends_cache.pop(next(iter(_trends_cache)))
+        _trends_cache[key] = (now, result)
+
+        # Drop per-key locks for evicted windows; a held lock belongs to an
+        # in-flight computation and stays until a later store.
+        for k in [k for k, lock in _trends_key_locks.items() if k not in _trends_cache and not lock.locked()]:
+            del _trends_key_locks[k]
+
+
+def _compute_trends(
+    db: Session,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    source: Optional[str] = "Gemini",
 ) -> Dict[str, Any]:
     """
     Compute comprehensive trend analysis across all dimensions.
@@ -378,15 +451,22 @@ def compute_trends(
     all_tips: List[FlatTip] = []
     all_results: List[FlatResult] = []
 
-    day = date_from
-    while day <= date_to:
+    days = [date_from + timedelta(days=i) for i in range((date_to - date_from).days + 1)]
+
+    # Results from API (cached). Days are independent network calls, so fetch
+    # them concurrently; the DB session stays on this thread.
+    cached_days = {
+        d for d in days
+        if d in _results_cache and _is_cache_valid(_results_cache[d][0])
+    }
+    with ThreadPoolExecutor(max_workers=max(1, min(RESULTS_FETCH_PARALLEL, len(days)))) as executor:
+        results_by_day = list(executor.map(_fetch_results_for_date, days))
+
+    for day, results in zip(days, results_by_day):
         # Tips from database (instant)
         tips = _fetch_tips_from_db(db, day, source=source)
 
-        # Results from API (cached)
-        results_cached = day in _results_cache and _is_cache_valid(_results_cache[day][0])
-        results = _fetch_results_for_date(day)
-
+        results_cached = day in cached_days
         if results_cached:
             cache_hits += 1
         else:
@@ -397,7 +477,6 @@ def compute_trends(
 
         all_tips.extend(tips)
         all_results.extend(results)
-        day += timedelta(days=1)
 
     print(f"[TRENDS] Results cache: {cache_hits} hits, {cache_misses} misses")
 
@@ -3,14 +3,27 @@ from __future__ import annotations
 
 import re
 from datetime import date as date_type, datetime
+from functools import lru_cache
 from typing import Any
 
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 
 from . import models
 
-# Single templates instance for the whole app
-templates = Jinja2Templates(directory="templates")
+# Single templates instance for the whole app. Templates only change on
+# deploy, so compiled templates are cached without limit and never
+# re-stat'ed for changes (same autoescape as Jinja2Templates' default env).
+# Compiled bytecode is also kept on disk (per-user temp dir) so fresh
+# worker processes skip parsing; entries are keyed on template source.
+_env = Environment(
+    loader=FileSystemLoader("templates"),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+templates = Jinja2Templates(env=_env)
 
 # ---------- Jinja filters ----------
 
@@ -89,6 +102,15 @@ templates.env.filters["decode_reasoning"] = decode_reasoning
 templates.env.filters["horse_label"] = extract_horse_label
 templates.env.filters["human_date"] = human_date
 
+
+def preload_templates() -> None:
+    """Compile every template up front so no request pays the parse cost."""
+    for name in _env.list_templates(extensions=["html"]):
+        _env.get_template(name)
+
+
+preload_templates()
+
 # ---------- UI helpers for /ui/day ----------
 
 def clean_text(text: str | None) -> str:
@@ -121,6 +143,12 @@ def clean_text(text: str | None) -> str:
     return t.strip()
 
 
+_TIP_LABEL_PREFIX_RE = re.compile(
+    r"^\s*(AI\s*Best|Best|Danger|Value)\s*:\s*[#No\.\s]*\d+\s*",
+    flags=re.IGNORECASE,
+)
+
+
 def display_horse_name(tip: models.Tip) -> str:
     """
     Return a clean horse name for display.
@@ -129,15 +157,13 @@ def display_horse_name(tip: models.Tip) -> str:
       "**Sensational Secret** \\u2014 Strong class"
       "AI Best: #2 Sweltering — Strong last 600m..."
     """
-    raw = tip.horse_name or ""
+    return _clean_horse_name(tip.horse_name or "")
 
+
+@lru_cache(maxsize=4096)
+def _clean_horse_name(raw: str) -> str:
     # If the AI accidentally kept "AI Best: #2 ..." etc, strip that off
-    raw = re.sub(
-        r"^\s*(AI\s*Best|Best|Danger|Value)\s*:\s*[#No\.\s]*\d+\s*",
-        "",
-        raw,
-        flags=re.IGNORECASE,
-    )
+    raw = _TIP_LABEL_PREFIX_RE.sub("", raw)
 
     # If there's an em dash / hyphen, keep only the left side (name)
     for sep in ["\u2014", "\\u2014", "—", " - ", "-"]:
@@ -154,11 +180,14 @@ def display_reason(tip: models.Tip) -> str:
     Prefer Tip.reasoning; fall back to the part of horse_name after the dash.
     Also strips any trailing 'Danger: ...' or 'Value: ...' that got jammed in.
     """
-    raw = tip.reasoning or ""
+    return _clean_reason(tip.reasoning or "", tip.horse_name or "")
+
 
+@lru_cache(maxsize=4096)
+def _clean_reason(raw: str, horse_name: str) -> str:
     if not raw:
         # Fallback: try to salvage text after the dash from horse_name
-        raw = tip.horse_name or ""
+        raw = horse_name
         for sep in ["\u2014", "\\u2014", "—", " - ", "-"]:
             if sep in raw:
                 raw = raw.split(sep, 1)[1]
@@ -171,6 +200,7 @@ def display_reason(tip: models.Tip) -> str:
 
     return clean_text(raw)
 
+@lru_cache(maxsize=512)
 def format_pretty_date(d: date_type) -> str:
     """e.g. Wednesday 19 November 2025."""
     try:
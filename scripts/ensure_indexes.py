@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Create model-declared indexes missing from existing tables.
+
+create_all() at app startup only indexes tables it creates itself; indexes
+added to a model later (e.g. ix_tips_race_id) are built here instead, once
+per deploy, so web workers never race each other on CREATE INDEX.
+
+On Postgres every index is built CONCURRENTLY IF NOT EXISTS, so writes to
+the table carry on while it builds and the script is safe to re-run. If a
+concurrent build is interrupted Postgres leaves an INVALID index behind;
+drop it and run this again.
+
+Usage:
+  DATABASE_URL=... python scripts/ensure_indexes.py
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from app import models  # noqa: E402,F401  (registers tables on Base.metadata)
+from app.database import ensure_indexes  # noqa: E402
+
+
+if __name__ == "__main__":
+    ensure_indexes()
+    print("indexes ensured")
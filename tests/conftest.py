@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the `app` package importable when pytest is run from anywhere.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
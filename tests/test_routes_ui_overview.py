@@ -0,0 +1,97 @@
+import os
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app import routes_ui_overview
+from app.database import Base, get_db
+from app.models import Meeting, Race, Tip, TipOutcome, TipRun
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY = date(2025, 1, 4)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    with Session() as db:
+        meeting = Meeting(date=DAY, track_name="Randwick", state="NSW")
+        db.add(meeting)
+        db.flush()
+        run = TipRun(source="Gemini", meeting_id=meeting.id)
+        db.add(run)
+        db.flush()
+        for race_no, (win_tab, lose_tab) in enumerate([(1, 2), (3, 4)], start=1):
+            race = Race(meeting_id=meeting.id, race_number=race_no)
+            db.add(race)
+            db.flush()
+            win = Tip(
+                tip_run_id=run.id, race_id=race.id, tip_type="AI_BEST",
+                tab_number=win_tab, horse_name=f"Winner {race_no}", stake_units=1,
+            )
+            lose = Tip(
+                tip_run_id=run.id, race_id=race.id, tip_type="DANGER",
+                tab_number=lose_tab, horse_name=f"Loser {race_no}", stake_units=1,
+            )
+            db.add_all([win, lose])
+            db.flush()
+            db.add_all([
+                TipOutcome(tip_id=win.id, outcome_status="WIN", starting_price=3.5),
+                TipOutcome(tip_id=lose.id, outcome_status="LOSE"),
+            ])
+        db.commit()
+
+    def _get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    # No RA results for any day: every tip day is aggregated in SQL.
+    monkeypatch.setattr(routes_ui_overview, "fetch_results_for_date_cached", lambda d: [])
+    monkeypatch.setattr(routes_ui_overview, "_overview_cache", {})
+    monkeypatch.chdir(ROOT)
+
+    app = FastAPI()
+    app.mount("/static", StaticFiles(directory="static"), name="static")
+    app.include_router(routes_ui_overview.router)
+    app.dependency_overrides[get_db] = _get_db
+    return TestClient(app)
+
+
+def test_overview_json_day_without_ra_results(client):
+    resp = client.get("/ui/overview", params={
+        "date_from": DAY.isoformat(), "date_to": DAY.isoformat(), "json": "true",
+    })
+    assert resp.status_code == 200
+    [row] = resp.json()["tracks"]
+    assert row["track"] == "Randwick"
+    assert row["tips"] == 4
+    assert row["wins"] == 2
+    assert row["places"] == 2
+    assert row["stakes"] == pytest.approx(4.0)
+    assert row["return"] == pytest.approx(7.0)
+    assert row["aiBestWins"] == 2
+    assert row["quaddieRaceNos"] == [1, 2]
+
+
+def test_overview_html_day_without_ra_results(client):
+    resp = client.get("/ui/overview", params={
+        "date_from": DAY.isoformat(), "date_to": DAY.isoformat(),
+    })
+    assert resp.status_code == 200
+    assert "Randwick" in resp.text